@@ -2,16 +2,60 @@
 
 Provides a base class for managing environment-specific configuration,
 including secrets retrieval from AWS Secrets Manager or local environment variables.
+
+Public names are resolved lazily on first access (PEP 562), so a Lambda that
+only uses ``EnvConfigBase`` does not pay the FastAPI/Mangum/pydantic import
+cost on cold start.
 """
 
-from .dispatch import create_dispatcher
-from .env_config import EnvConfigBase, SecretCacheConfig
-from .webhook import (
-    GithubWebhookParser,
-    GithubWebhookRouter,
-    GithubWebhookValidator,
-    create_app,
-)
+from __future__ import annotations
+
+import importlib
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache import CacheInfo as CacheInfo
+    from .cache import async_redis_cache as async_redis_cache
+    from .dispatch import create_dispatcher as create_dispatcher
+    from .env_config import EnvConfigBase as EnvConfigBase
+    from .env_config import SecretCacheConfig as SecretCacheConfig
+    from .eventbridge import EventBridgePublisher as EventBridgePublisher
+    from .eventbridge import EventBridgeRouter as EventBridgeRouter
+    from .github import LambdaThrottler as LambdaThrottler
+    from .slack import SlackNotifier as SlackNotifier
+    from .webhook import GithubWebhookParser as GithubWebhookParser
+    from .webhook import GithubWebhookRouter as GithubWebhookRouter
+    from .webhook import GithubWebhookValidator as GithubWebhookValidator
+    from .webhook import create_app as create_app
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS: dict[str, str] = {
+    "EnvConfigBase": ".env_config",
+    "SecretCacheConfig": ".env_config",
+    "GithubWebhookRouter": ".webhook",
+    "GithubWebhookValidator": ".webhook",
+    "GithubWebhookParser": ".webhook",
+    "create_dispatcher": ".dispatch",
+    "create_app": ".webhook",
+    # Optional eventbridge module (EventBridgePublisher requires aioboto3 package)
+    "EventBridgePublisher": ".eventbridge",
+    "EventBridgeRouter": ".eventbridge",
+    # Optional cache module (requires redis package)
+    "async_redis_cache": ".cache",
+    "CacheInfo": ".cache",
+    # Optional github module (requires githubkit package)
+    "LambdaThrottler": ".github",
+    # Optional slack module (requires slack_sdk package)
+    "SlackNotifier": ".slack",
+}
+
+# Submodule -> third-party packages it needs at import time
+_OPTIONAL_REQUIREMENTS: dict[str, tuple[str, ...]] = {
+    ".cache": ("redis",),
+    ".github": ("githubkit", "pottery_semaphore", "redis"),
+    ".slack": ("slack_sdk",),
+}
 
 __all__ = [
     "EnvConfigBase",
@@ -21,38 +65,35 @@ __all__ = [
     "GithubWebhookParser",
     "create_dispatcher",
     "create_app",
+    "EventBridgePublisher",
+    "EventBridgeRouter",
 ]
+# Only advertise optional names whose dependencies are installed; find_spec
+# checks availability without importing the packages
+__all__.extend(
+    name
+    for name, module in _LAZY_ATTRS.items()
+    if module in _OPTIONAL_REQUIREMENTS
+    and all(find_spec(req) is not None for req in _OPTIONAL_REQUIREMENTS[module])
+)
 
-# Optional eventbridge module (EventBridgePublisher requires aioboto3 package)
-try:
-    from .eventbridge import EventBridgePublisher, EventBridgeRouter
-
-    __all__.extend(["EventBridgePublisher", "EventBridgeRouter"])
-except ImportError:
-    EventBridgePublisher = None  # type: ignore[assignment,misc]
-    EventBridgeRouter = None  # type: ignore[assignment,misc]
-
-# Optional cache module (requires redis package)
-try:
-    from .cache import CacheInfo, async_redis_cache
-
-    __all__.extend(["async_redis_cache", "CacheInfo"])
-except ImportError:
-    async_redis_cache = None  # type: ignore[assignment,misc]
-    CacheInfo = None  # type: ignore[assignment,misc]
-
-# Optional github module (requires githubkit package)
-try:
-    from .github import LambdaThrottler
 
-    __all__.append("LambdaThrottler")
-except ImportError:
-    LambdaThrottler = None  # type: ignore[assignment,misc]
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining *name* on first access and cache it."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        if module_name not in _OPTIONAL_REQUIREMENTS:
+            raise
+        # Optional dependency missing: keep the historical ``None`` placeholder
+        value = None
+    globals()[name] = value
+    return value
 
-# Optional slack module (requires slack_sdk package)
-try:
-    from .slack import SlackNotifier
 
-    __all__.append("SlackNotifier")
-except ImportError:
-    SlackNotifier = None  # type: ignore[assignment,misc]
+def __dir__() -> list[str]:
+    """Include lazily-resolved names in ``dir()``."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -4,21 +4,77 @@ Provides an async-compatible caching decorator similar to pottery's redis_cache,
 supporting TTL, custom key functions, and JSON serialization.
 """
 
+import asyncio
 import functools
 import hashlib
+import io
 import json
 import logging
+import pickle
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any, ParamSpec, TypeVar, overload
+from typing import Any, Literal, ParamSpec, TypeVar, overload
 
 from redis.asyncio import Redis as AIORedis
+from redis.asyncio.client import Pipeline
 from redis.exceptions import RedisError
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+try:
+    import ormsgpack as _ormsgpack
+except ImportError:
+    _ormsgpack = None
+
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
 __all__ = ["async_redis_cache", "CacheInfo"]
 
 _DEFAULT_TIMEOUT: int = 60  # One minute in seconds
 
+_MISSING_REDIS_MESSAGE = (
+    "Either 'redis' or 'redis_url' must be provided to async_redis_cache"
+)
+
+# Size in bytes of the BLAKE2b digest of call arguments in default cache keys
+_ARG_DIGEST_SIZE = 8
+
+# Maximum number of generated cache keys memoized per decorated function
+_KEY_MEMO_MAXSIZE = 1024
+
+# Argument types whose value and exact type fully determine the cache key.
+# Containers are left out because equal contents can serialize differently
+# (``(1,)`` vs ``(True,)``), and floats because ``0.0 == -0.0``
+_MEMO_SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+# Number of index members requested per ZSCAN round-trip in cache_clear
+_SCAN_COUNT = 500
+
+# Maximum number of keys removed by a single UNLINK in cache_clear
+_DELETE_BATCH_SIZE = 500
+
+# zstd compression level for cached values over compress_min_size
+_ZSTD_LEVEL = 3
+
+# Magic number that starts every zstd frame; neither JSON nor MessagePack
+# values longer than one byte can begin with it
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Prefix for the Redis sorted set that indexes every key written by a decorated
+# function, scored by the key's expiry time. Distinct from the prefix of the
+# older plain-SET index, so a leftover SET never makes ZADD fail with WRONGTYPE
+_INDEX_KEY_PREFIX = "lambda_framework.cache:zindex:"
+
+# Index score for keys stored without a timeout
+_NEVER_EXPIRES = float("inf")
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
@@ -27,16 +83,19 @@ JSONTypes = str | int | float | bool | None | list[Any] | dict[str, Any]
 
 logger = logging.getLogger(__name__)
 
+# Process-wide async Redis clients, keyed by URL
+_CLIENTS: dict[str, AIORedis] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class CacheInfo:
     """Cache statistics, similar to functools.lru_cache().cache_info().
 
     Note:
         Statistics are approximate in concurrent scenarios. The hit/miss counters
         are not thread-safe and may have minor inaccuracies under high concurrency.
-        The currsize only tracks keys added by the current process, not the total
-        number of keys in Redis.
+        The currsize only counts keys newly indexed by the current process, not
+        the total number of keys in Redis.
 
     """
 
@@ -45,36 +104,235 @@ class CacheInfo:
     currsize: int = 0
 
 
-def _encode(value: JSONTypes) -> str:
-    """Encode a value to JSON string, matching pottery's encoding.
+def _shared_client(redis_url: str) -> AIORedis:
+    """Return the process-wide async Redis client for *redis_url*.
+
+    The client is created on first request and reused by every decorator
+    bound to the same URL, so they share one connection pool.  Like any
+    ``redis.asyncio`` client, it should only be used from a single event loop.
+
+    Args:
+        redis_url: A Redis URL string.
+
+    Returns:
+        The shared async Redis client.
+
+    """
+    client = _CLIENTS.get(redis_url)
+    if client is None:
+        client = _CLIENTS[redis_url] = AIORedis.from_url(redis_url)
+    return client
+
+
+def _encode(value: JSONTypes) -> bytes:
+    """Encode a value to compact JSON bytes.
+
+    Values are only ever read back by :func:`_decode`, so key order is
+    irrelevant and keys are not sorted.  Uses orjson when installed, which
+    emits bytes directly; the Redis client sends them without re-encoding.
 
     Args:
         value: A JSON-serializable value.
 
     Returns:
-        A JSON string with sorted keys for consistent hashing.
+        Compact UTF-8 JSON bytes (no whitespace after separators).
 
     """
-    return json.dumps(value, sort_keys=True)
+    if _orjson is not None:
+        return _orjson.dumps(value, option=_orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":")).encode()
 
 
-def _decode(encoded_value: str) -> JSONTypes:
-    """Decode a JSON string back to a Python value.
+def _decode(encoded_value: bytes | str) -> JSONTypes:
+    """Decode JSON bytes (as returned by Redis) back to a Python value.
 
     Args:
-        encoded_value: A JSON string.
+        encoded_value: UTF-8 JSON bytes, or a JSON string when the client
+            was created with ``decode_responses=True``.
 
     Returns:
         The decoded Python value.
 
     """
+    if _orjson is not None:
+        return _orjson.loads(encoded_value)
     return json.loads(encoded_value)
 
 
+def _encode_msgpack(value: Any) -> bytes:
+    """Encode a value to MessagePack bytes with ormsgpack.
+
+    Args:
+        value: A MessagePack-serializable value (bytes and non-string dict
+            keys are preserved, unlike JSON).
+
+    Returns:
+        The packed bytes.
+
+    """
+    return _ormsgpack.packb(value, option=_ormsgpack.OPT_NON_STR_KEYS)
+
+
+def _decode_msgpack(encoded_value: bytes) -> Any:
+    """Decode MessagePack bytes (as returned by Redis) back to a Python value.
+
+    Args:
+        encoded_value: The packed bytes.
+
+    Returns:
+        The decoded Python value.
+
+    """
+    return _ormsgpack.unpackb(encoded_value)
+
+
+def _encode_raw(value: Any) -> bytes:
+    """Pass bytes returned by the decorated function through unchanged.
+
+    Args:
+        value: The function result, which must be bytes-like.
+
+    Returns:
+        The value as bytes.
+
+    Raises:
+        TypeError: If the value is not bytes-like.
+
+    """
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, bytearray | memoryview):
+        return bytes(value)
+    raise TypeError(
+        f"The 'raw' cache serializer requires bytes, got {type(value).__name__}"
+    )
+
+
+def _decode_raw(encoded_value: bytes) -> bytes:
+    """Return cached bytes as stored, without decoding."""
+    return encoded_value
+
+
+# Serializer name -> (encode, decode)
+_SERIALIZERS: dict[str, tuple[Callable[[Any], bytes], Callable[[Any], Any]]] = {
+    "json": (_encode, _decode),
+    "msgpack": (_encode_msgpack, _decode_msgpack),
+    "raw": (_encode_raw, _decode_raw),
+}
+
+
+def _compressing(
+    encode: Callable[[Any], bytes],
+    decode: Callable[[Any], Any],
+    min_size: int,
+    serializer: str,
+) -> tuple[Callable[[Any], bytes], Callable[[Any], Any]]:
+    """Wrap a serializer pair with zstd compression of large values.
+
+    Values shorter than *min_size* bytes are stored as the serializer emits
+    them; compressed values are recognised by the zstd frame magic number, so
+    both kinds can be read back regardless of when they were written.
+
+    Args:
+        encode: The serializer's encode function.
+        decode: The serializer's decode function.
+        min_size: Smallest encoded size, in bytes, that gets compressed.
+        serializer: The serializer name, used to reject ``"raw"``.
+
+    Returns:
+        The wrapped (encode, decode) pair.
+
+    Raises:
+        ValueError: If *serializer* is ``"raw"``, whose bytes could look
+            like a zstd frame.
+        ImportError: If zstandard is not installed.
+
+    """
+    if serializer == "raw":
+        raise ValueError("compress_min_size cannot be used with the 'raw' serializer")
+    if _zstd is None:
+        raise ImportError(
+            "zstandard is missing, please install the 'zstd' optional dependency."
+        )
+    compressor = _zstd.ZstdCompressor(level=_ZSTD_LEVEL)
+    decompressor = _zstd.ZstdDecompressor()
+
+    def compressing_encode(value: Any) -> bytes:
+        """Encode *value*, compressing the result when it is large."""
+        encoded_value = encode(value)
+        if len(encoded_value) >= min_size:
+            return compressor.compress(encoded_value)
+        return encoded_value
+
+    def decompressing_decode(encoded_value: bytes) -> Any:
+        """Decompress *encoded_value* if it is a zstd frame, then decode it."""
+        if encoded_value[:4] == _ZSTD_MAGIC:
+            encoded_value = decompressor.decompress(encoded_value)
+        return decode(encoded_value)
+
+    return compressing_encode, decompressing_decode
+
+
+def _func_name(func: Callable[..., Any]) -> str:
+    """Return the ``module:qualname`` identifier used in cache keys."""
+    func_name = getattr(func, "__qualname__", func.__name__)  # type: ignore[attr-defined]
+    func_module = getattr(func, "__module__", "__main__")
+    return f"{func_module}:{func_name}"
+
+
+def _hash_args(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """Hash call arguments into a short, process-independent digest.
+
+    Args:
+        args: Positional arguments passed to the function.
+        kwargs: Keyword arguments passed to the function.
+
+    Returns:
+        The 8-byte BLAKE2b digest of the JSON-encoded arguments, as 16 hex chars.
+
+    """
+    # Serialize arguments to JSON for deterministic hashing
+    # Sort kwargs for consistent ordering
+    # Always stdlib json, so keys match whether or not orjson is installed
+    if kwargs:
+        key_data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
+    else:
+        # Positional-only calls (the common case) skip building the wrapper
+        # dict; the output is byte-identical to the general branch
+        key_data = f'{{"args": {json.dumps(args, sort_keys=True)}, "kwargs": {{}}}}'
+    # Digest the requested size directly instead of truncating a longer hash
+    return hashlib.blake2b(key_data.encode(), digest_size=_ARG_DIGEST_SIZE).hexdigest()
+
+
+def _hash_args_pickled(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """Hash call arguments via pickle, for the opt-in ``fast_keys`` mode.
+
+    Pickling is done in C and accepts any picklable argument, so it is several
+    times faster than JSON for nested structures. The digest is only stable
+    across processes running the same Python version, and not for arguments
+    whose pickled form depends on hash order (e.g. sets of strings).
+
+    Args:
+        args: Positional arguments passed to the function.
+        kwargs: Keyword arguments passed to the function.
+
+    Returns:
+        The 8-byte BLAKE2b digest of the pickled arguments, as 16 hex chars.
+
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=5)
+    # Without the memo, equal values pickle identically whether or not they
+    # are the same object, so equal arguments always map to the same key
+    pickler.fast = True
+    pickler.dump((args, sorted(kwargs.items())))
+    return hashlib.blake2b(buffer.getbuffer(), digest_size=_ARG_DIGEST_SIZE).hexdigest()
+
+
 def _default_key_func(func: Callable[P, Any], *args: Any, **kwargs: Any) -> str:
     """Generate a cache key from function signature and arguments.
 
-    Uses a deterministic hash (SHA-256) to ensure consistent cache keys
+    Uses a deterministic hash (BLAKE2b) to ensure consistent cache keys
     across Python interpreter restarts (unlike Python's built-in hash()
     which is randomized by PYTHONHASHSEED).
 
@@ -86,14 +344,40 @@ def _default_key_func(func: Callable[P, Any], *args: Any, **kwargs: Any) -> str:
     Returns:
         A string cache key combining the function name and argument hash.
 
+    Note:
+        Up to 0.4.x the argument hash was the first 16 hex chars of a SHA-256
+        digest. Keys written by those releases are never read again.
+
     """
-    # Serialize arguments to JSON for deterministic hashing
-    # Sort kwargs for consistent ordering
-    key_data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
-    arg_hash = hashlib.sha256(key_data.encode()).hexdigest()[:16]
-    func_name = getattr(func, "__qualname__", func.__name__)  # type: ignore[attr-defined]
-    func_module = getattr(func, "__module__", "__main__")
-    return f"{func_module}:{func_name}:{arg_hash}"
+    return f"{_func_name(func)}:{_hash_args(args, kwargs)}"
+
+
+def _memo_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Any, ...] | None:
+    """Build a hashable lookup key for memoizing generated cache keys.
+
+    Only calls whose arguments are all flat scalars (see
+    ``_MEMO_SCALAR_TYPES``) are memoized. Argument types are part of the key
+    so that values which compare equal but serialize differently (e.g. ``1``
+    and ``True``) stay distinct.
+
+    Args:
+        args: Positional arguments passed to the function.
+        kwargs: Keyword arguments passed to the function.
+
+    Returns:
+        The lookup key, or None if the call cannot be memoized safely.
+
+    """
+    arg_types = tuple(map(type, args))
+    if not _MEMO_SCALAR_TYPES.issuperset(arg_types):
+        return None
+    if not kwargs:
+        return (args, arg_types)
+    items = tuple(sorted(kwargs.items()))
+    value_types = tuple(type(v) for _, v in items)
+    if not _MEMO_SCALAR_TYPES.issuperset(value_types):
+        return None
+    return (args, arg_types, items, value_types)
 
 
 @overload
@@ -104,6 +388,11 @@ def async_redis_cache(
     key: str | None = None,
     timeout: int | None = _DEFAULT_TIMEOUT,
     key_func: Callable[..., str] | None = None,
+    memoize_keys: bool | None = None,
+    fast_keys: bool = False,
+    serializer: Literal["json", "msgpack", "raw"] = "json",
+    refresh_ahead: float | None = None,
+    compress_min_size: int | None = None,
 ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]: ...
 
 
@@ -121,6 +410,11 @@ def async_redis_cache(  # noqa: C901
     key: str | None = None,
     timeout: int | None = _DEFAULT_TIMEOUT,
     key_func: Callable[..., str] | None = None,
+    memoize_keys: bool | None = None,
+    fast_keys: bool = False,
+    serializer: Literal["json", "msgpack", "raw"] = "json",
+    refresh_ahead: float | None = None,
+    compress_min_size: int | None = None,
 ) -> (
     Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]
     | Callable[P, Awaitable[R]]
@@ -129,11 +423,14 @@ def async_redis_cache(  # noqa: C901
 
     This decorator caches the results of async functions in Redis with support for
     TTL (time-to-live), custom key generation, and JSON serialization.
+    Concurrent calls that map to the same cache key within a process share a
+    single Redis lookup and, on a miss, a single call of the wrapped function.
 
     Args:
         func: The async function to decorate (when used without parentheses).
         redis: An existing async Redis client instance.
-        redis_url: A Redis URL string to create a new connection.
+        redis_url: A Redis URL string. The client for each URL is created once
+            per process and shared by all decorators using that URL.
             Either `redis` or `redis_url` must be provided.
         key: Optional key prefix for the cache. Defaults to function's qualified name.
         timeout: Time-to-live in seconds for cached values.
@@ -141,13 +438,62 @@ def async_redis_cache(  # noqa: C901
         key_func: Optional custom function to generate cache keys.
             Should accept (func, *args, **kwargs) and return a string.
             Defaults to pottery-style key generation using argument hashing.
+        memoize_keys: Whether to memoize generated cache keys in-process for
+            calls whose arguments are all ``str``, ``int``, ``bool`` or
+            ``None``, skipping key generation on repeated calls. Defaults to
+            None, which memoizes the default generated keys but not the
+            results of a custom `key_func`, since those may depend on more
+            than the arguments (tenant, context variables, time, ...). Pass
+            True to memoize a `key_func` that is a pure function of its
+            arguments.
+        fast_keys: Whether to hash arguments with pickle instead of JSON for
+            the default key function. Faster for nested arguments and accepts
+            any picklable value, but keys are only shared between processes
+            on the same Python version and are unstable for set arguments.
+            Keys are never memoized in this mode, whatever `memoize_keys` says.
+            Defaults to False. Cannot be combined with `key_func`.
+        serializer: How cached values are stored. ``"json"`` (the default)
+            is readable by any client; ``"msgpack"`` is smaller and faster for
+            numeric-heavy values and can store bytes, but requires the
+            ``msgpack`` extra and a client with ``decode_responses=False``.
+            ``"raw"`` stores and returns the bytes the function returns as-is,
+            with no encode or decode step, e.g. a pre-rendered JSON body to
+            send in a ``Response``; it also needs ``decode_responses=False``.
+        refresh_ahead: When set, a hit whose remaining TTL is below this many
+            seconds is returned immediately while the value is recomputed and
+            stored in a background task, so warm keys never expire into a
+            slow miss. Requires `timeout`. Background refreshes only progress
+            while the event loop runs: handlers run by `create_dispatcher` or
+            `EventBridgeRouter` get a fresh loop per invocation via
+            ``asyncio.run``, which cancels any refresh still pending when the
+            handler returns. A dropped refresh leaves the current value
+            cached, and the next near-expiry hit starts a new one.
+        compress_min_size: When set, encoded values of at least this many
+            bytes are zstd-compressed before being stored, cutting Redis
+            memory and bytes on the wire for large payloads. Requires the
+            ``zstd`` extra and a client with ``decode_responses=False``; not
+            available with the ``"raw"`` serializer.
 
     Returns:
         A decorated async function with caching enabled.
 
     Raises:
         ValueError: If neither `redis` nor `redis_url` is provided when the
-            decorated function is called.
+            decorated function is called, if `serializer` is unknown, or if
+            `refresh_ahead` is given without a `timeout`, if
+            `compress_min_size` is combined with the ``"raw"`` serializer, or
+            if `fast_keys` is combined with `key_func`.
+        ImportError: If `serializer` is ``"msgpack"`` and ormsgpack is not
+            installed, or if `compress_min_size` is set and zstandard is not
+            installed.
+
+    Note:
+        After 0.4.x default cache keys hash the arguments with an 8-byte
+        BLAKE2b digest instead of truncated SHA-256, so upgrading invalidates
+        every value cached by a 0.4.x or earlier release. The old entries are not
+        indexed and `cache_clear` does not remove them; they expire with their
+        TTL, and those stored with ``timeout=None`` must be deleted by hand.
+        Keys from a custom `key_func` are unaffected.
 
     Example:
         Basic usage with Redis URL::
@@ -175,6 +521,20 @@ def async_redis_cache(  # noqa: C901
                 return await fetch_user(user_id)
 
     """
+    try:
+        encode, decode = _SERIALIZERS[serializer]
+    except KeyError:
+        raise ValueError(f"Unknown cache serializer: {serializer!r}") from None
+    if serializer == "msgpack" and _ormsgpack is None:
+        raise ImportError(
+            "ormsgpack is missing, please install the 'msgpack' optional dependency."
+        )
+    if refresh_ahead is not None and timeout is None:
+        raise ValueError("refresh_ahead requires a timeout")
+    if fast_keys and key_func is not None:
+        raise ValueError("fast_keys cannot be used with a custom key_func")
+    if compress_min_size is not None:
+        encode, decode = _compressing(encode, decode, compress_min_size, serializer)
 
     def decorator(  # noqa: C901
         fn: Callable[P, Awaitable[R]],
@@ -182,75 +542,231 @@ def async_redis_cache(  # noqa: C901
         # Cache statistics
         cache_info = CacheInfo()
 
-        # Track all cache keys for this function
-        _cache_keys: set[str] = set()
-
-        # Lazy Redis client initialization
-        _redis_client: AIORedis | None = redis
-
-        async def _get_redis() -> AIORedis:
-            nonlocal _redis_client
-            if _redis_client is None:
-                if redis_url is None:
-                    raise ValueError(
-                        "Either 'redis' or 'redis_url' must be provided to "
-                        "async_redis_cache"
+        # The function name and key prefix never change for a decorated
+        # function, so build them once rather than on every call
+        namespace = _func_name(fn)
+        if key is not None:
+            namespace = f"{key}:{namespace}"
+        default_key_prefix = f"{namespace}:"
+        key_prefix = f"{key}:" if key is not None else ""
+
+        # Cache keys are indexed server-side in a Redis sorted set so that
+        # cache_clear also sees keys written by other Lambda instances
+        index_key = f"{_INDEX_KEY_PREFIX}{namespace}"
+
+        # Resolve the Redis client once; decorators bound to the same URL share
+        # a single client and connection pool
+        redis_client: AIORedis | None = redis
+        if redis_client is None and redis_url is not None:
+            redis_client = _shared_client(redis_url)
+
+        # The key function, key memo and store commands below are picked once
+        # per decorated function so the call path carries no option branches
+        if key_func is None:
+            hash_args = _hash_args_pickled if fast_keys else _hash_args
+
+            def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+                """Generate the full cache key from the argument hash."""
+                return default_key_prefix + hash_args(args, kwargs)
+
+        else:
+
+            def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+                """Generate the full cache key with the custom key function."""
+                return key_prefix + key_func(fn, *args, **kwargs)
+
+        # Bounded FIFO memo of generated cache keys, keyed by call arguments
+        _key_memo: dict[tuple[Any, ...], str] = {}
+
+        def _memoized_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+            """Return the cache key, reusing a memoized one when possible."""
+            memo_key = _memo_key(args, kwargs)
+            if memo_key is None:
+                # Containers, floats and other objects are keyed afresh
+                return _make_key(args, kwargs)
+            cache_key = _key_memo.get(memo_key)
+            if cache_key is None:
+                cache_key = _make_key(args, kwargs)
+                if len(_key_memo) >= _KEY_MEMO_MAXSIZE:
+                    del _key_memo[next(iter(_key_memo))]
+                _key_memo[memo_key] = cache_key
+            return cache_key
+
+        # Pickled arguments are often mutable objects that hash by identity, so
+        # a memoized key could outlive a change to the argument's contents
+        memoize = key_func is None if memoize_keys is None else memoize_keys
+        _get_key = _memoized_key if memoize and not fast_keys else _make_key
+
+        if timeout is None:
+
+            def _queue_store(pipe: Pipeline, cache_key: str, value: bytes) -> None:
+                """Queue the SET and index ZADD for a non-expiring value."""
+                pipe.set(cache_key, value)
+                pipe.zadd(index_key, {cache_key: _NEVER_EXPIRES})
+
+        else:
+
+            def _queue_store(pipe: Pipeline, cache_key: str, value: bytes) -> None:
+                """Queue the SET, index ZADD, prune and index EXPIRE for a value."""
+                now = time.time()
+                pipe.set(cache_key, value, ex=timeout)
+                pipe.zadd(index_key, {cache_key: now + timeout})
+                # Drop members whose keys have already expired, so an index that
+                # is written to forever stays bounded by the live keys
+                pipe.zremrangebyscore(index_key, "-inf", now)
+                # Keep the index alive at least as long as its newest key
+                pipe.expire(index_key, timeout)
+
+        if refresh_ahead is None:
+
+            async def _lookup(
+                client: AIORedis,
+                cache_key: str,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+            ) -> Any:
+                """Fetch the cached value for *cache_key*."""
+                return await client.get(cache_key)
+
+        else:
+            refresh_ahead_ms = refresh_ahead * 1000
+            # Background refreshes in flight, keyed by cache key; holding the
+            # tasks also keeps them from being garbage collected mid-run
+            _refreshing: dict[str, asyncio.Task[None]] = {}
+
+            async def _refresh(
+                client: AIORedis,
+                cache_key: str,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+            ) -> None:
+                """Recompute and store a value that is about to expire."""
+                try:
+                    encoded_value = encode(await fn(*args, **kwargs))  # type: ignore[arg-type]
+                    async with client.pipeline(transaction=False) as pipe:
+                        _queue_store(pipe, cache_key, encoded_value)
+                        await pipe.execute()
+                except Exception:
+                    # The current value stays cached until it expires
+                    logger.debug("Background refresh failed for key %s", cache_key)
+
+            async def _lookup(
+                client: AIORedis,
+                cache_key: str,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+            ) -> Any:
+                """Fetch the cached value, refreshing it if it expires soon."""
+                # PTTL rides along in the same round-trip as the GET
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.get(cache_key)
+                    pipe.pttl(cache_key)
+                    cached_value, ttl_ms = await pipe.execute()
+                if (
+                    cached_value is not None
+                    and 0 <= ttl_ms < refresh_ahead_ms
+                    and cache_key not in _refreshing
+                ):
+                    task = asyncio.create_task(
+                        _refresh(client, cache_key, args, kwargs)
                     )
-                _redis_client = AIORedis.from_url(redis_url)
-            return _redis_client
-
-        def _make_key(*args: Any, **kwargs: Any) -> str:
-            """Generate the full cache key."""
-            if key_func is not None:
-                base_key = key_func(fn, *args, **kwargs)
-            else:
-                base_key = _default_key_func(fn, *args, **kwargs)
-
-            if key is not None:
-                return f"{key}:{base_key}"
-            return base_key
-
+                    _refreshing[cache_key] = task
+                    task.add_done_callback(lambda _: _refreshing.pop(cache_key, None))
+                return cached_value
+
+        # Encoded results of lookups currently in flight, keyed by cache key.
+        # Concurrent callers for the same key await the first caller's lookup
+        # instead of each hitting Redis and, on a miss, running fn themselves
+        _inflight: dict[str, asyncio.Future[bytes]] = {}
+
+        async def _await_inflight(
+            pending: asyncio.Future[bytes],
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+        ) -> R:
+            """Return the result of a lookup another caller already started."""
+            try:
+                # Shielded so a cancelled waiter does not cancel the lookup
+                # shared with the other callers
+                encoded_value = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task and task.cancelling()):
+                    raise
+                # The first caller was cancelled; look the value up afresh
+                return await wrapper(*args, **kwargs)
+            cache_info.hits += 1
+            return decode(encoded_value)
+
+        # wrapper stays a plain coroutine function rather than a callable
+        # class: functools.wraps runs once at decoration time, and a function
+        # keeps iscoroutinefunction() checks and method binding working
         @functools.wraps(fn)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            client = await _get_redis()
-            cache_key = _make_key(*args, **kwargs)
-
-            # Try to get cached value
+            client = redis_client
+            if client is None:
+                raise ValueError(_MISSING_REDIS_MESSAGE)
+            # Helpers take the packed args/kwargs as-is rather than re-spreading
+            # them into a fresh tuple and dict at every hop
+            cache_key = _get_key(args, kwargs)
+
+            pending = _inflight.get(cache_key)
+            if pending is not None:
+                return await _await_inflight(pending, args, kwargs)
+
+            pending = asyncio.get_running_loop().create_future()
+            _inflight[cache_key] = pending
             try:
-                cached_value = await client.get(cache_key)
-                if cached_value is not None:
-                    cache_info.hits += 1
-                    return _decode(cached_value)  # type: ignore[return-value]
-            except RedisError:
-                # On Redis errors, fall through to call the function
-                # This matches pottery's behavior of graceful degradation
-                logger.debug(
-                    "Redis cache get failed for key %s, calling function", cache_key
-                )
-
-            # Cache miss - call the function
-            cache_info.misses += 1
-            result = await fn(*args, **kwargs)
+                # Try to get cached value
+                try:
+                    cached_value = await _lookup(client, cache_key, args, kwargs)
+                    if cached_value is not None:
+                        cache_info.hits += 1
+                        pending.set_result(cached_value)
+                        return decode(cached_value)
+                except RedisError:
+                    # On Redis errors, fall through to call the function
+                    # This matches pottery's behavior of graceful degradation
+                    logger.debug(
+                        "Redis cache get failed for key %s, calling function",
+                        cache_key,
+                    )
 
-            # Store result in cache
-            try:
-                encoded_value = _encode(result)  # type: ignore[arg-type]
-                if timeout is not None:
-                    await client.set(cache_key, encoded_value, ex=timeout)
-                else:
-                    await client.set(cache_key, encoded_value)
-                # Track this key for potential clearing
-                _cache_keys.add(cache_key)
-            except RedisError:
-                # On Redis errors, silently fail - the function result is still returned
-                # This matches pottery's behavior
-                logger.debug("Redis cache set failed for key %s", cache_key)
+                # Cache miss - call the function
+                cache_info.misses += 1
+                result = await fn(*args, **kwargs)
+                encoded_value = encode(result)
+                # Waiters are released before the store round-trip
+                pending.set_result(encoded_value)
 
-            return result
+                # Store result and index the key in a single round-trip
+                try:
+                    async with client.pipeline(transaction=False) as pipe:
+                        _queue_store(pipe, cache_key, encoded_value)
+                        _, added, *_ = await pipe.execute()
+                    cache_info.currsize += added
+                except RedisError:
+                    # On Redis errors, silently fail - the function result is
+                    # still returned. This matches pottery's behavior
+                    logger.debug("Redis cache set failed for key %s", cache_key)
+
+                return result
+            except Exception as exc:
+                if not pending.done():
+                    # Waiters see the same exception as the first caller;
+                    # reading it back marks it retrieved when nobody waited
+                    pending.set_exception(exc)
+                    pending.exception()
+                raise
+            except BaseException:
+                # Cancelled: waiters retry the lookup themselves
+                pending.cancel()
+                raise
+            finally:
+                del _inflight[cache_key]
 
         def get_cache_info() -> CacheInfo:
-            """Return cache statistics with current size from tracked keys."""
-            cache_info.currsize = len(_cache_keys)
+            """Return cache statistics for this function."""
             return cache_info
 
         # Attach cache_info as an attribute (similar to functools.lru_cache)
@@ -259,22 +775,110 @@ def async_redis_cache(  # noqa: C901
         async def cache_clear() -> None:
             """Clear all cached values for this function from Redis.
 
-            Deletes all tracked cache keys from Redis and resets local statistics.
-            Only keys that were set during this process's lifetime will be cleared.
+            Deletes every key recorded in the function's Redis index (including
+            keys written by other processes) along with the index itself, then
+            resets local statistics.
             """
-            if _cache_keys:
-                try:
-                    client = await _get_redis()
-                    await client.delete(*_cache_keys)
-                    logger.debug("Cleared %d cache keys", len(_cache_keys))
-                except RedisError:
-                    logger.debug("Failed to clear cache keys from Redis")
-            _cache_keys.clear()
+            client = redis_client
+            if client is None:
+                raise ValueError(_MISSING_REDIS_MESSAGE)
+            try:
+                # ZSCAN keeps each reply bounded, unlike ZRANGE on a large index,
+                # and chunked UNLINKs keep any single command small. UNLINK
+                # frees the values on a background thread, so large cached
+                # payloads do not stall the Redis main thread as DEL would.
+                # Commands are buffered until execute(), so the index is not
+                # modified while it is being scanned.
+                cleared = 0
+                async with client.pipeline(transaction=False) as pipe:
+                    batch: list[Any] = []
+                    async for cache_key, _ in client.zscan_iter(
+                        index_key, count=_SCAN_COUNT
+                    ):
+                        batch.append(cache_key)
+                        if len(batch) >= _DELETE_BATCH_SIZE:
+                            pipe.unlink(*batch)
+                            cleared += len(batch)
+                            batch = []
+                    if batch:
+                        pipe.unlink(*batch)
+                        cleared += len(batch)
+                    if cleared:
+                        pipe.unlink(index_key)
+                        await pipe.execute()
+                        logger.debug("Cleared %d cache keys", cleared)
+            except RedisError:
+                logger.debug("Failed to clear cache keys from Redis")
             cache_info.hits = 0
             cache_info.misses = 0
+            cache_info.currsize = 0
 
         wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
 
+        async def batch_get(*calls: tuple[Any, ...]) -> list[R]:
+            """Return the cached results for several calls at once.
+
+            Every call is looked up with a single MGET. Calls that miss run
+            concurrently, and their results are stored in one pipelined
+            round-trip.
+
+            Args:
+                *calls: One tuple of positional arguments per call.
+
+            Returns:
+                The results, in the same order as *calls*.
+
+            """
+            client = redis_client
+            if client is None:
+                raise ValueError(_MISSING_REDIS_MESSAGE)
+            no_kwargs: dict[str, Any] = {}
+            keys = [_get_key(args, no_kwargs) for args in calls]
+            if not keys:
+                return []
+
+            try:
+                cached_values = await client.mget(keys)
+            except RedisError:
+                logger.debug("Redis cache mget failed, calling function")
+                cached_values = [None] * len(keys)
+
+            results: dict[str, Any] = {}
+            missing: dict[str, tuple[Any, ...]] = {}
+            for cache_key, args, cached_value in zip(
+                keys, calls, cached_values, strict=True
+            ):
+                if cached_value is not None:
+                    cache_info.hits += 1
+                    results[cache_key] = decode(cached_value)
+                elif cache_key not in missing:
+                    missing[cache_key] = args
+
+            if missing:
+                cache_info.misses += len(missing)
+                computed = await asyncio.gather(
+                    *(fn(*args) for args in missing.values())  # type: ignore[arg-type]
+                )
+                encoded_values = [encode(result) for result in computed]
+                results.update(zip(missing, computed, strict=True))
+                try:
+                    async with client.pipeline(transaction=False) as pipe:
+                        for cache_key, encoded_value in zip(
+                            missing, encoded_values, strict=True
+                        ):
+                            _queue_store(pipe, cache_key, encoded_value)
+                        replies = await pipe.execute()
+                    # Each store queues the same commands, with ZADD second
+                    cache_info.currsize += sum(
+                        replies[1 :: len(replies) // len(missing)]
+                    )
+                except RedisError:
+                    logger.debug("Redis cache set failed for %d keys", len(missing))
+
+            return [results[cache_key] for cache_key in keys]
+
+        wrapper.batch_get = batch_get  # type: ignore[attr-defined]
+
         return wrapper
 
     # Support both @async_redis_cache and @async_redis_cache(...) syntax
@@ -4,6 +4,7 @@ Provides a base class for managing environment-specific configuration,
 including secrets retrieval from AWS Secrets Manager or local environment variables.
 """
 
+import functools
 import json
 import os
 from typing import Any
@@ -12,8 +13,38 @@ import botocore
 import botocore.session
 from aws_secretsmanager_caching import SecretCache, SecretCacheConfig
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 __all__ = ["EnvConfigBase", "SecretCacheConfig"]
 
+# SecretCache instances shared by every EnvConfigBase built with the same cache
+# config (None meaning the default config), for the lifetime of the container
+_SECRET_CACHES: dict[SecretCacheConfig | None, SecretCache] = {}
+
+# Last parsed payload per secret name, as (raw secret string, parsed dict)
+_PARSED_SECRETS: dict[str, tuple[str, dict[str, Any]]] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _secrets_client() -> Any:
+    """Return the process-wide Secrets Manager client.
+
+    Creating a botocore session loads service models from disk, so the
+    session and client are built once per Lambda container and shared by
+    every ``EnvConfigBase`` instance.
+    """
+    return botocore.session.get_session().create_client("secretsmanager")
+
+
+def _loads(raw: str) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
 
 class EnvConfigBase:
     """Base class for environment configuration management.
@@ -58,10 +89,11 @@ class EnvConfigBase:
 
     @staticmethod
     def _setup_secret_cache(config: SecretCacheConfig | None = None) -> SecretCache:
-        secrets_client = botocore.session.get_session().create_client("secretsmanager")
-        if config is None:
-            config = SecretCacheConfig()
-        return SecretCache(config, secrets_client)
+        secret_cache = _SECRET_CACHES.get(config)
+        if secret_cache is None:
+            secret_cache = SecretCache(config or SecretCacheConfig(), _secrets_client())
+            _SECRET_CACHES[config] = secret_cache
+        return secret_cache
 
     @property
     def load_local_secrets(self) -> bool:
@@ -76,6 +108,10 @@ class EnvConfigBase:
     def _get_parsed_secrets(self) -> dict[str, Any]:
         """Retrieve and cache the parsed secrets dictionary from AWS Secrets Manager.
 
+        The parsed dictionary is shared with other instances reading the same
+        secret, and is only re-parsed when the cached secret string changes
+        (e.g. after a rotation picked up by the ``SecretCache``).
+
         Returns:
             The parsed secrets dictionary.
 
@@ -90,8 +126,14 @@ class EnvConfigBase:
             raise ValueError(
                 "Expected secret cache to be setup when loading secrets from AWS Secrets Manager"
             )
-        raw_secret: str = self._secret_cache.get_secret_string(self._aws_secret_name)
-        parsed: dict[str, Any] = json.loads(raw_secret)
+        secret_name: str = self._aws_secret_name  # type: ignore[assignment]
+        raw_secret: str = self._secret_cache.get_secret_string(secret_name)
+        shared = _PARSED_SECRETS.get(secret_name)
+        if shared is not None and shared[0] == raw_secret:
+            parsed = shared[1]
+        else:
+            parsed = _loads(raw_secret)
+            _PARSED_SECRETS[secret_name] = (raw_secret, parsed)
         self._parsed_secrets = parsed
         return parsed
 
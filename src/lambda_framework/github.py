@@ -1,6 +1,7 @@
 """GitHub rate limiter module."""
 
 import asyncio
+import threading
 import time
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
@@ -11,20 +12,49 @@ from githubkit.throttling import BaseThrottler
 from pottery_semaphore import AIOSemaphore, Semaphore
 from redis import Redis
 from redis.asyncio import Redis as AIORedis
+from redis.commands.core import AsyncScript, Script
 from typing_extensions import override
 
 __all__ = ["LambdaThrottler"]
 
 _DEFAULT_THROTTLE_KEY = "github-request-limit"
 _DEFAULT_MUTATING_SLEEP_SECONDS = 1.0
+_DEFAULT_MUTATING_BURST = 1
+
+# Atomic GCRA token bucket shared by every Lambda instance.  Reserves the next
+# slot for a mutating request and returns how many milliseconds the caller must
+# wait before sending it (0 when a token is available).
+#   KEYS[1]: bucket key, holding the theoretical arrival time (TAT) in ms
+#   ARGV[1]: emission interval in ms between mutating requests
+#   ARGV[2]: burst capacity (requests allowed back-to-back)
+_PACE_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+    tat = now
+end
+local wait = tat - now - interval * (burst - 1)
+if wait < 0 then
+    wait = 0
+end
+local new_tat = tat + interval
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+return wait
+"""
 
 
 class LambdaThrottler(BaseThrottler):
     """Lambda throttler for GitHub API rate limiting.
 
     Uses a distributed semaphore (via Redis/Valkey) to limit concurrent requests
-    across multiple Lambda instances. Optionally adds a delay after mutating
-    HTTP methods (POST, PUT, PATCH, DELETE) to respect GitHub's secondary rate limits.
+    across multiple Lambda instances. Mutating HTTP methods (POST, PUT, PATCH,
+    DELETE) are additionally paced by a Redis-side token bucket shared by all
+    instances, to respect GitHub's secondary rate limits. A request never waits
+    after it completes; any pacing delay is charged to the next mutating request
+    before it is sent.
 
     Args:
         max_concurrency: Maximum number of concurrent requests allowed.
@@ -32,12 +62,24 @@ class LambdaThrottler(BaseThrottler):
         valkey: Existing synchronous Redis client instance.
         aiovalkey: Existing async Redis client instance.
         throttle_key: Redis key for the distributed semaphore. Defaults to "github-request-limit".
-        mutating_sleep_seconds: Seconds to sleep after mutating requests. Defaults to 1.0.
-            Set to 0 to disable the delay.
+        mutating_sleep_seconds: Minimum interval in seconds between mutating requests
+            across all instances. Defaults to 1.0. Set to 0 to disable pacing.
+        mutating_burst: Number of mutating requests allowed back-to-back before
+            pacing kicks in. Defaults to 1.
+        local_read_slack: Number of concurrent non-mutating requests per instance
+            that may skip the distributed semaphore, saving its Redis round-trips.
+            Defaults to 0 (every request takes the semaphore). Reads on the fast
+            path do not count against ``max_concurrency``, so keep
+            ``instances * local_read_slack`` within GitHub's concurrency limit.
+
+    Raises:
+        ValueError: If ``mutating_burst`` is less than 1 or
+            ``local_read_slack`` is negative.
 
     """
 
-    _MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+    # Built once per class; each request's method is an O(1) set lookup
+    _MUTATING_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
 
     def __init__(
         self,
@@ -47,16 +89,29 @@ class LambdaThrottler(BaseThrottler):
         aiovalkey: AIORedis | None = None,
         throttle_key: str = _DEFAULT_THROTTLE_KEY,
         mutating_sleep_seconds: float = _DEFAULT_MUTATING_SLEEP_SECONDS,
+        mutating_burst: int = _DEFAULT_MUTATING_BURST,
+        local_read_slack: int = 0,
     ) -> None:
         """Initialize the throttler."""
+        if mutating_burst < 1:
+            raise ValueError("mutating_burst must be at least 1")
+        if local_read_slack < 0:
+            raise ValueError("local_read_slack must not be negative")
         self.max_concurrency = max_concurrency
         self._valkey_url: str | None = valkey_url
         self._valkey: Redis | None = valkey
         self._aiovalkey: AIORedis | None = aiovalkey
         self._throttle_key = throttle_key
-        self._mutating_sleep_seconds = mutating_sleep_seconds
+        self._mutating_interval_ms = int(mutating_sleep_seconds * 1000)
+        self._mutating_burst = mutating_burst
+        self._pace_key = f"{throttle_key}:mutating"
         self._semaphore: Semaphore | None = None
         self._async_semaphore: AIOSemaphore | None = None
+        self._pace_script: Script | None = None
+        self._async_pace_script: AsyncScript | None = None
+        self._local_read_slack = local_read_slack
+        self._local_inflight = 0
+        self._local_lock = threading.Lock()
 
     def _get_valkey(self) -> Redis:
         """Get the valkey."""
@@ -96,40 +151,97 @@ class LambdaThrottler(BaseThrottler):
             )
         return self._async_semaphore
 
+    @property
+    def pace_script(self) -> Script:
+        """Get the token bucket script."""
+        if self._pace_script is None:
+            self._pace_script = self._get_valkey().register_script(_PACE_SCRIPT)
+        return self._pace_script
+
+    @property
+    def async_pace_script(self) -> AsyncScript:
+        """Get the async token bucket script."""
+        if self._async_pace_script is None:
+            self._async_pace_script = self._get_aiovalkey().register_script(
+                _PACE_SCRIPT
+            )
+        return self._async_pace_script
+
+    def _should_pace(self, request: httpx.Request) -> bool:
+        """Whether *request* must take a token from the mutating bucket."""
+        return (
+            self._mutating_interval_ms > 0 and request.method in self._MUTATING_METHODS
+        )
+
+    def _pace_args(self) -> list[int]:
+        """Arguments passed to the token bucket script."""
+        return [self._mutating_interval_ms, self._mutating_burst]
+
+    def _enter_fast_path(self, request: httpx.Request) -> bool:
+        """Take a local read slot if *request* may skip the semaphore."""
+        if self._local_read_slack <= 0 or request.method in self._MUTATING_METHODS:
+            return False
+        with self._local_lock:
+            if self._local_inflight >= self._local_read_slack:
+                return False
+            self._local_inflight += 1
+            return True
+
+    def _exit_fast_path(self) -> None:
+        """Release a local read slot."""
+        with self._local_lock:
+            self._local_inflight -= 1
+
     @override
     @contextmanager
     def acquire(self, request: httpx.Request) -> Generator[None, Any, Any]:
         """Acquire the semaphore for a request.
 
-        The semaphore limits concurrent requests. After the request completes,
-        if it was a mutating method (POST, PUT, PATCH, DELETE), a configurable
-        delay is added before returning. This delay occurs AFTER releasing the
-        semaphore, so it doesn't block other concurrent requests.
+        The semaphore limits concurrent requests. Mutating methods (POST, PUT,
+        PATCH, DELETE) first reserve a slot in the shared token bucket with a
+        single script call and wait only as long as the bucket requires. The
+        wait happens BEFORE acquiring the semaphore, so it doesn't block other
+        concurrent requests. With ``local_read_slack`` set, non-mutating
+        requests skip the semaphore while this instance has free local slots.
 
         """
+        if self._enter_fast_path(request):
+            try:
+                yield
+            finally:
+                self._exit_fast_path()
+            return
+        if self._should_pace(request):
+            wait_ms = self.pace_script(keys=[self._pace_key], args=self._pace_args())
+            if wait_ms:
+                time.sleep(wait_ms / 1000)
         with self.semaphore:
             yield
-        if (
-            request.method in self._MUTATING_METHODS
-            and self._mutating_sleep_seconds > 0
-        ):
-            time.sleep(self._mutating_sleep_seconds)
 
     @override
     @asynccontextmanager
     async def async_acquire(self, request: httpx.Request) -> AsyncGenerator[None, Any]:
         """Acquire the semaphore for an async request.
 
-        The semaphore limits concurrent requests. After the request completes,
-        if it was a mutating method (POST, PUT, PATCH, DELETE), a configurable
-        delay is added before returning. This delay occurs AFTER releasing the
-        semaphore, so it doesn't block other concurrent requests.
+        The semaphore limits concurrent requests. Mutating methods (POST, PUT,
+        PATCH, DELETE) first reserve a slot in the shared token bucket with a
+        single script call and wait only as long as the bucket requires. The
+        wait happens BEFORE acquiring the semaphore, so it doesn't block other
+        concurrent requests. With ``local_read_slack`` set, non-mutating
+        requests skip the semaphore while this instance has free local slots.
 
         """
+        if self._enter_fast_path(request):
+            try:
+                yield
+            finally:
+                self._exit_fast_path()
+            return
+        if self._should_pace(request):
+            wait_ms = await self.async_pace_script(
+                keys=[self._pace_key], args=self._pace_args()
+            )
+            if wait_ms:
+                await asyncio.sleep(wait_ms / 1000)
         async with self.async_semaphore:
             yield
-        if (
-            request.method in self._MUTATING_METHODS
-            and self._mutating_sleep_seconds > 0
-        ):
-            await asyncio.sleep(self._mutating_sleep_seconds)
@@ -1,12 +1,14 @@
 """GitHub webhook module."""
 
-import asyncio
+import hashlib
+import hmac
 import inspect
 import json
-from collections.abc import Callable
-from functools import wraps
-from types import UnionType
+from collections.abc import Awaitable, Callable, Iterable
+from functools import update_wrapper, wraps
+from types import FunctionType, UnionType
 from typing import TYPE_CHECKING, Annotated, Any, TypeVar
+from weakref import WeakKeyDictionary
 
 from fastapi import (
     APIRouter,
@@ -17,19 +19,105 @@ from fastapi import (
     Request,
     Security,
 )
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
 
 if TYPE_CHECKING:
     from githubkit.versions.latest.webhooks import WebhookEvent
 
 E = TypeVar("E", bound="WebhookEvent")
 
+# Prefix GitHub puts in front of the hex HMAC in X-Hub-Signature-256
+_SIGNATURE_PREFIX = "sha256="
+
+# GitHub sends the digest as exactly 64 lower-case hex characters
+_SIGNATURE_HEX_LENGTH = 64
+_SIGNATURE_HEX_DIGITS = frozenset("0123456789abcdef")
+
 __all__ = ["GithubWebhookValidator", "GithubWebhookParser", "GithubWebhookRouter"]
 
 try:
-    from githubkit.webhooks import parse_obj, verify
+    from githubkit.webhooks import parse_obj
 except ImportError:
     parse_obj = None
-    verify = None
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Handler signatures, held weakly so the cache never keeps a handler alive
+_SIGNATURES: WeakKeyDictionary[Callable[..., Any], inspect.Signature] = (
+    WeakKeyDictionary()
+)
+
+
+def _handler_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """Return the signature of *func*, computed once per live handler."""
+    try:
+        return _SIGNATURES[func]
+    except KeyError:
+        sig = _SIGNATURES[func] = inspect.signature(func)
+        return sig
+    except TypeError:
+        # Callables that are unhashable or not weakly referenceable
+        return inspect.signature(func)
+
+
+def _with_signature(
+    func: Callable[..., Any], sig: inspect.Signature
+) -> Callable[..., Any]:
+    """Return an endpoint that runs *func* but advertises *sig* to FastAPI.
+
+    Plain functions are copied rather than wrapped, so FastAPI awaits async
+    handlers and threadpools sync ones directly with no extra call frame.
+    Other callables get a thin wrapper of the same kind.
+
+    Args:
+        func: The user's webhook handler.
+        sig: The signature FastAPI should read dependencies from.
+
+    Returns:
+        A callable with ``__signature__`` set to *sig*.
+
+    """
+    if isinstance(func, FunctionType):
+        endpoint = FunctionType(
+            func.__code__,
+            func.__globals__,
+            func.__name__,
+            func.__defaults__,
+            func.__closure__,
+        )
+        endpoint.__kwdefaults__ = func.__kwdefaults__
+        update_wrapper(endpoint, func)
+    elif inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        type(func).__call__
+    ):
+        # Other callables (partials, callable objects) cannot be copied; their
+        # kind is fixed, so it is decided here rather than on every request
+        @wraps(func)
+        async def endpoint(*args: Any, **kw: Any) -> Any:
+            return await func(*args, **kw)
+
+    else:
+
+        @wraps(func)
+        def endpoint(*args: Any, **kw: Any) -> Any:
+            return func(*args, **kw)
+
+    endpoint.__signature__ = sig  # type: ignore[attr-defined]
+    return endpoint
 
 
 class GithubWebhookValidator:
@@ -39,6 +127,9 @@ class GithubWebhookValidator:
     webhook requests are authentically from GitHub.
     """
 
+    # Read on every request; slots avoid a per-instance __dict__
+    __slots__ = ("_hmac_proto", "_secret")
+
     def __init__(self, secret: str) -> None:
         """Initialize the validator with a webhook secret.
 
@@ -47,6 +138,9 @@ class GithubWebhookValidator:
 
         """
         self._secret = secret
+        # The keyed inner/outer pads are derived once; each request copies
+        # this prototype instead of re-keying an HMAC from the secret
+        self._hmac_proto = hmac.new(secret.encode(), digestmod=hashlib.sha256)
 
     async def __call__(
         self,
@@ -67,18 +161,54 @@ class GithubWebhookValidator:
             The validated payload dictionary.
 
         Raises:
-            ImportError: If githubkit is not installed.
             HTTPException: If the signature is invalid (401 Unauthorized).
 
         """
-        if verify is None:
-            raise ImportError(
-                "Githubkit is missing, please install the 'github' optional dependency."
-            )
         raw_body = await request.body()
-        if not verify(self._secret, raw_body, x_hub_signature_256):
+        if not self.verify(raw_body, x_hub_signature_256):
             raise HTTPException(status_code=401, detail="Invalid signature")
-        return json.loads(raw_body)
+        # The verified bytes are parsed exactly once
+        return _loads(raw_body)
+
+    def verify(self, body: bytes, signature: str) -> bool:
+        """Check an ``X-Hub-Signature-256`` value against the raw request body.
+
+        Args:
+            body: The raw request body, exactly as GitHub signed it.
+            signature: The signature header sent by GitHub.
+
+        Returns:
+            True if *signature* is the HMAC-SHA256 of *body* under the secret.
+
+        """
+        # Only SHA-256 signatures are accepted, as the header name implies.
+        # The hex tail is decoded so the 32 raw digest bytes are compared
+        # directly instead of hex-encoding the expected digest. It is checked
+        # first because bytes.fromhex also accepts whitespace and upper case,
+        # which would let several header values verify for one digest
+        if not signature.startswith(_SIGNATURE_PREFIX):
+            return False
+        hex_digest = signature[len(_SIGNATURE_PREFIX) :]
+        if len(hex_digest) != _SIGNATURE_HEX_LENGTH or not (
+            _SIGNATURE_HEX_DIGITS.issuperset(hex_digest)
+        ):
+            return False
+        mac = self._hmac_proto.copy()
+        mac.update(body)
+        return hmac.compare_digest(mac.digest(), bytes.fromhex(hex_digest))
+
+    def verify_many(self, items: Iterable[tuple[bytes, str]]) -> list[bool]:
+        """Verify several ``(body, signature)`` pairs, e.g. one batch of records.
+
+        Args:
+            items: Raw bodies paired with their ``X-Hub-Signature-256`` values.
+
+        Returns:
+            One result per pair, in order, as `verify` would return it.
+
+        """
+        verify = self.verify
+        return [verify(body, signature) for body, signature in items]
 
 
 class GithubWebhookParser:
@@ -88,6 +218,8 @@ class GithubWebhookParser:
     webhook event classes based on the X-GitHub-Event header.
     """
 
+    __slots__ = ("_dependency", "parse_obj", "validator")
+
     def __init__(self, validator: GithubWebhookValidator) -> None:
         """Initialize the parser with a validator dependency.
 
@@ -105,9 +237,24 @@ class GithubWebhookParser:
         self.parse_obj = parse_obj
         self.validator: GithubWebhookValidator = validator
 
+        # One dependency callable shared by every route: FastAPI caches
+        # dependency results per request by callable, so the router-level
+        # dependency and the handler's event parameter parse the payload once.
+        # It is async so FastAPI runs it on the event loop instead of
+        # dispatching it to a worker thread
+        parse_obj_fn = parse_obj
+
+        async def _parse(
+            payload: Annotated[dict[str, Any], Security(validator)],
+            x_github_event: Annotated[str, Header()],
+        ) -> Any:
+            return parse_obj_fn(x_github_event, payload)
+
+        self._dependency = _parse
+
     def as_dependency(
         self, event_type: type[E] | UnionType | None = None
-    ) -> Callable[..., E]:
+    ) -> Callable[..., Awaitable[E]]:
         """Create a FastAPI dependency that parses and returns the webhook event.
 
         Args:
@@ -116,18 +263,10 @@ class GithubWebhookParser:
 
         Returns:
             A dependency function that returns the parsed event with proper typing.
+            The same function is returned for every event type.
 
         """
-        validator = self.validator
-        parse_obj_fn = self.parse_obj
-
-        def _parse(
-            payload: Annotated[dict[str, Any], Security(validator)],
-            x_github_event: Annotated[str, Header()],
-        ) -> E:
-            return parse_obj_fn(x_github_event, payload)  # type: ignore[return-value]
-
-        return _parse
+        return self._dependency
 
 
 class GithubWebhookRouter:
@@ -147,6 +286,8 @@ class GithubWebhookRouter:
 
     """
 
+    __slots__ = ("_parser", "_router", "_webhook_secret")
+
     def __init__(self, webhook_secret: str) -> None:
         """Initialize the webhook router.
 
@@ -175,6 +316,8 @@ class GithubWebhookRouter:
         The decorated function's first parameter will receive the parsed WebhookEvent.
         You can use specific event types (e.g., PushEvent, CheckRunEvent) for better typing.
         Other parameters can still use FastAPI's dependency injection.
+        Annotate the return type (or pass ``response_model``) to have FastAPI
+        serialize responses straight to JSON bytes through Pydantic.
 
         Args:
             path: The URL path for the webhook endpoint (default: "/").
@@ -191,7 +334,7 @@ class GithubWebhookRouter:
         """
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            sig = inspect.signature(func)
+            sig = _handler_signature(func)
             params = list(sig.parameters.values())
 
             if not params:
@@ -222,19 +365,73 @@ class GithubWebhookRouter:
             )
             new_sig = sig.replace(parameters=[new_event_param] + params[1:])
 
-            # Create async wrapper - FastAPI handles both sync and async
-            @wraps(func)
-            async def wrapper(*args: Any, **kw: Any) -> Any:
-                result = func(*args, **kw)
-                if asyncio.iscoroutine(result):
-                    return await result
-                return result
-
-            # Set the modified signature - FastAPI reads this
-            wrapper.__signature__ = new_sig  # type: ignore[attr-defined]
+            # Set the modified signature on a copy of the handler - FastAPI
+            # reads it, and the user's function is left untouched
+            endpoint = _with_signature(func, new_sig)
 
             # Register with the router
-            self._router.post(path, **kwargs)(wrapper)
+            self._router.post(path, **kwargs)(endpoint)
+            return func
+
+        return decorator
+
+    def add_raw_webhook(
+        self, path: str = "/"
+    ) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
+        """Register a handler that receives only the parsed event.
+
+        Unlike `add_webhook`, the endpoint is a plain Starlette route: it reads
+        the headers and body itself, checks the signature and parses the
+        event without going through FastAPI's dependency solver. Use it for
+        hot webhook paths whose handler takes nothing but the event.
+        Missing headers are rejected with 422 and bad signatures with 401, as
+        with `add_webhook`; the handler's return value is sent as JSON unless
+        it already is a ``Response``.
+
+        Args:
+            path: The URL path for the webhook endpoint (default: "/").
+
+        Returns:
+            A decorator that registers the function as a POST route.
+
+        Example:
+            @webhook_router.add_raw_webhook("/github")
+            async def handle_push(event: PushEvent):
+                return {"ref": event.ref}
+
+        """
+        validator = self._parser.validator
+        parse_obj_fn = self._parser.parse_obj
+
+        def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+            # Decided once: async handlers are awaited, sync ones threadpooled
+            is_async = inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+                type(func).__call__
+            )
+
+            async def endpoint(request: Request) -> Response:
+                signature = request.headers.get("x-hub-signature-256")
+                event_name = request.headers.get("x-github-event")
+                if signature is None or event_name is None:
+                    raise HTTPException(
+                        status_code=422,
+                        detail="Missing X-Hub-Signature-256 or X-GitHub-Event header",
+                    )
+                body = await request.body()
+                if not validator.verify(body, signature):
+                    raise HTTPException(status_code=401, detail="Invalid signature")
+                event = parse_obj_fn(event_name, _loads(body))
+                if is_async:
+                    result = await func(event)
+                else:
+                    result = await run_in_threadpool(func, event)
+                if isinstance(result, Response):
+                    return result
+                return JSONResponse(jsonable_encoder(result))
+
+            # Plain routes skip the router-level validation dependency, which
+            # the endpoint replaces
+            self._router.add_route(path, endpoint, methods=["POST"])
             return func
 
         return decorator
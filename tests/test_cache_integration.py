@@ -6,35 +6,94 @@ or Docker will be used to start a container automatically.
 """
 
 import asyncio
+import time
+import uuid
 from collections.abc import Generator
 from typing import Any
+from urllib.parse import urlsplit
 
 import pytest
+import pytest_asyncio
+
+try:
+    from redis import Redis as SyncRedis
+    from redis.asyncio import Redis
+    from redis.exceptions import ConnectionError as RedisConnectionError
+except ImportError:
+    pytest.skip("redis is not installed", allow_module_level=True)
+
+from lambda_framework.cache import _INDEX_KEY_PREFIX, async_redis_cache
+
+
+def _wait_for_valkey(url: str, timeout: float = 10.0) -> None:
+    """Block until Valkey at *url* answers PING, with capped backoff."""
+    client = SyncRedis.from_url(url)
+    delay = 0.01
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                client.ping()
+                return
+            except RedisConnectionError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+    finally:
+        client.close()
+
+
+def _xdist_worker_db(config: pytest.Config) -> int | None:
+    """Return a logical DB index for this pytest-xdist worker, if any.
+
+    Each worker gets its own database ("gw0" -> 0, "gw1" -> 1, ...) so that
+    FLUSHDB in one worker never wipes keys another worker's tests rely on.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return None
+    # Valkey ships with 16 logical databases by default
+    return int(workerinput["workerid"].removeprefix("gw")) % 16
+
 
-from lambda_framework.cache import async_redis_cache
+def _with_db(url: str, db: int | None) -> str:
+    """Point *url* at logical database *db*, leaving it unchanged if None."""
+    if db is None:
+        return url
+    return urlsplit(url)._replace(path=f"/{db}").geturl()
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestAsyncRedisCacheIntegration:
     """Integration tests for async_redis_cache using real Valkey instance.
 
     The fixture automatically starts/stops the Docker container.
     Set VALKEY_URL environment variable to use an existing instance instead.
+
+    All tests share one event loop so the class-scoped Redis client (and its
+    connection pool) can be reused across them.
     """
 
     @pytest.fixture(scope="class")
-    def valkey_url(self) -> Generator[str, Any, Any]:
+    def valkey_url(self, request: pytest.FixtureRequest) -> Generator[str, Any, Any]:
         """Start Valkey container and return connection URL.
 
         If VALKEY_URL is set, uses that instead of starting a container.
+        Under pytest-xdist (``pytest -n auto -m integration``) each worker
+        connects to its own logical database; the shared container is left
+        running for the other workers, so stop it afterwards with
+        ``docker compose -f docker-compose.test.yml down``.
         """
         import os
         import subprocess
-        import time
         from pathlib import Path
 
+        db = _xdist_worker_db(request.config)
+
         # If VALKEY_URL is set, use existing instance
         if "VALKEY_URL" in os.environ:
-            yield os.environ["VALKEY_URL"]
+            yield _with_db(os.environ["VALKEY_URL"], db)
             return
 
         # Find docker-compose file
@@ -55,24 +114,25 @@ class TestAsyncRedisCacheIntegration:
         except FileNotFoundError:
             pytest.skip("Docker not found")
 
-        # Give it a moment to be ready
-        time.sleep(0.5)
+        url = _with_db("redis://localhost:6379", db)
 
-        url = "redis://localhost:6379"
         try:
+            # --wait covers the container healthcheck; also poll the
+            # published port rather than sleeping a fixed amount
+            _wait_for_valkey(url)
             yield url
         finally:
-            # Stop container after tests
-            subprocess.run(
-                ["docker", "compose", "-f", str(compose_file), "down"],
-                capture_output=True,
-            )
-
-    @pytest.fixture(scope="class")
+            # Stop container after tests, unless other xdist workers may
+            # still be using it
+            if db is None:
+                subprocess.run(
+                    ["docker", "compose", "-f", str(compose_file), "down"],
+                    capture_output=True,
+                )
+
+    @pytest_asyncio.fixture(scope="class", loop_scope="class")
     async def _check_valkey_available(self, valkey_url: str):
         """Check if Valkey is available, skip tests if not."""
-        from redis.asyncio import Redis
-
         client = Redis.from_url(valkey_url)
         try:
             await client.ping()
@@ -82,22 +142,43 @@ class TestAsyncRedisCacheIntegration:
         finally:
             await client.aclose()  # type: ignore[attr-defined]
 
-    @pytest.fixture
-    async def redis_client(self, valkey_url: str, _check_valkey_available):
-        """Create an async Redis client for the test."""
-        from redis.asyncio import Redis
+    @pytest.fixture(autouse=True)
+    def _isolated_shared_clients(self, monkeypatch: pytest.MonkeyPatch):
+        """Give each test (and its event loop) its own URL-shared Redis clients."""
+        monkeypatch.setattr("lambda_framework.cache._CLIENTS", {})
 
+    @pytest_asyncio.fixture(scope="class", loop_scope="class")
+    async def redis_client(self, valkey_url: str, _check_valkey_available):
+        """Create one async Redis client shared by every test in the class."""
         client = Redis.from_url(valkey_url)
         yield client
-        await client.flushdb()
         await client.aclose()  # type: ignore[attr-defined]
 
+    @pytest_asyncio.fixture(loop_scope="class")
+    async def cache_prefix(self, redis_client):
+        """Yield a unique cache key prefix and delete this test's keys after.
+
+        Cleanup walks the cache's own key indexes for the prefix rather
+        than flushing the database, so it only touches keys this test wrote.
+        """
+        prefix = f"test-{uuid.uuid4().hex}"
+        yield prefix
+        index_keys = [
+            index_key
+            async for index_key in redis_client.scan_iter(
+                match=f"{_INDEX_KEY_PREFIX}{prefix}:*"
+            )
+        ]
+        for index_key in index_keys:
+            members = await redis_client.zrange(index_key, 0, -1)
+            await redis_client.unlink(index_key, *members)
+
     @pytest.mark.integration
-    async def test_basic_caching(self, valkey_url: str, _check_valkey_available):
+    async def test_basic_caching(self, valkey_url: str, cache_prefix: str):
         """Should cache and retrieve values from Valkey."""
         call_count = 0
 
-        @async_redis_cache(redis_url=valkey_url, timeout=60)
+        @async_redis_cache(redis_url=valkey_url, key=cache_prefix, timeout=60)
         async def compute(x: int) -> int:
             nonlocal call_count
             call_count += 1
@@ -119,11 +200,13 @@ class TestAsyncRedisCacheIntegration:
         assert call_count == 2
 
     @pytest.mark.integration
-    async def test_ttl_expiration(self, valkey_url: str, _check_valkey_available):
+    async def test_ttl_expiration(
+        self, valkey_url: str, redis_client, cache_prefix: str
+    ):
         """Should expire cached values after TTL."""
         call_count = 0
 
-        @async_redis_cache(redis_url=valkey_url, timeout=1)
+        @async_redis_cache(redis_url=valkey_url, key=cache_prefix, timeout=1)
         async def get_value() -> str:
             nonlocal call_count
             call_count += 1
@@ -139,8 +222,11 @@ class TestAsyncRedisCacheIntegration:
         assert result2 == "value-1"
         assert call_count == 1
 
-        # Wait for TTL to expire
-        await asyncio.sleep(1.5)
+        # Wait for TTL to expire, polling rather than sleeping past it
+        deadline = time.monotonic() + 5
+        while await redis_client.keys(f"{cache_prefix}:*"):
+            assert time.monotonic() < deadline, "cached value never expired"
+            await asyncio.sleep(0.05)
 
         # Third call - should recompute
         result3 = await get_value()
@@ -148,10 +234,12 @@ class TestAsyncRedisCacheIntegration:
         assert call_count == 2
 
     @pytest.mark.integration
-    async def test_cache_clear_removes_from_valkey(self, valkey_url: str, redis_client):
+    async def test_cache_clear_removes_from_valkey(
+        self, valkey_url: str, redis_client, cache_prefix: str
+    ):
         """cache_clear should remove keys from Valkey."""
 
-        @async_redis_cache(redis_url=valkey_url, key="testclear", timeout=300)
+        @async_redis_cache(redis_url=valkey_url, key=cache_prefix, timeout=300)
         async def func(x: int) -> int:
             return x
 
@@ -161,21 +249,21 @@ class TestAsyncRedisCacheIntegration:
         await func(3)
 
         # Verify keys exist
-        keys = await redis_client.keys("testclear:*")
+        keys = await redis_client.keys(f"{cache_prefix}:*")
         assert len(keys) == 3
 
         # Clear cache
         await func.cache_clear()  # type: ignore[attr-defined]
 
         # Verify keys are deleted
-        keys_after = await redis_client.keys("testclear:*")
+        keys_after = await redis_client.keys(f"{cache_prefix}:*")
         assert len(keys_after) == 0
 
     @pytest.mark.integration
-    async def test_complex_data_types(self, valkey_url: str, _check_valkey_available):
+    async def test_complex_data_types(self, valkey_url: str, cache_prefix: str):
         """Should handle complex JSON-serializable data types."""
 
-        @async_redis_cache(redis_url=valkey_url, timeout=60)
+        @async_redis_cache(redis_url=valkey_url, key=cache_prefix, timeout=60)
         async def get_complex_data() -> dict:
             return {
                 "string": "hello",
@@ -194,10 +282,10 @@ class TestAsyncRedisCacheIntegration:
         assert result1["nested"]["a"]["b"]["c"] == "deep"
 
     @pytest.mark.integration
-    async def test_cache_info_accuracy(self, valkey_url: str, _check_valkey_available):
+    async def test_cache_info_accuracy(self, valkey_url: str, cache_prefix: str):
         """cache_info should accurately track hits, misses, and size."""
 
-        @async_redis_cache(redis_url=valkey_url, timeout=60)
+        @async_redis_cache(redis_url=valkey_url, key=cache_prefix, timeout=60)
         async def func(x: int) -> int:
             return x * 2
 
@@ -222,12 +310,12 @@ class TestAsyncRedisCacheIntegration:
         assert info2.currsize == 3
 
     @pytest.mark.integration
-    async def test_concurrent_access(self, valkey_url: str, _check_valkey_available):
-        """Should handle concurrent access correctly."""
+    async def test_concurrent_access(self, valkey_url: str, cache_prefix: str):
+        """Concurrent calls for the same arguments should run the function once."""
         call_count = 0
         call_lock = asyncio.Lock()
 
-        @async_redis_cache(redis_url=valkey_url, timeout=60)
+        @async_redis_cache(redis_url=valkey_url, key=cache_prefix, timeout=60)
         async def slow_func(x: int) -> int:
             nonlocal call_count
             async with call_lock:
@@ -245,14 +333,18 @@ class TestAsyncRedisCacheIntegration:
         )
 
         assert results == [2, 2, 2, 4, 4]
-        # Due to race conditions, might have some extra calls but should be cached
-        assert call_count >= 2  # At least 2 unique values
+        # Concurrent misses for the same key share a single call
+        assert call_count == 2
+
+        info = slow_func.cache_info()  # type: ignore[attr-defined]
+        assert info.misses == 2
+        assert info.hits == 3
 
     @pytest.mark.integration
-    async def test_with_existing_redis_client(self, redis_client):
+    async def test_with_existing_redis_client(self, redis_client, cache_prefix: str):
         """Should work with an existing Redis client instance."""
 
-        @async_redis_cache(redis=redis_client, timeout=60)
+        @async_redis_cache(redis=redis_client, key=cache_prefix, timeout=60)
         async def func() -> str:
             return "test-value"
 
@@ -261,3 +353,24 @@ class TestAsyncRedisCacheIntegration:
 
         info = func.cache_info()  # type: ignore[attr-defined]
         assert info.misses == 1
+
+    @pytest.mark.integration
+    async def test_batch_get(self, redis_client, cache_prefix: str):
+        """batch_get should mix cached and freshly computed values."""
+        call_count = 0
+
+        @async_redis_cache(redis=redis_client, key=cache_prefix, timeout=60)
+        async def double(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x * 2
+
+        await double(1)
+        results = await double.batch_get((1,), (2,), (3,))  # type: ignore[attr-defined]
+
+        assert results == [2, 4, 6]
+        assert call_count == 3
+
+        # Everything is cached now
+        assert await double.batch_get((3,), (2,)) == [6, 4]  # type: ignore[attr-defined]
+        assert call_count == 3
@@ -1,62 +1,106 @@
 """Unit tests for the async_redis_cache module."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import subprocess
+import sys
+import types
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from lambda_framework.cache import (
+    _INDEX_KEY_PREFIX,
     CacheInfo,
     _decode,
     _default_key_func,
     _encode,
+    _hash_args,
+    _hash_args_pickled,
     async_redis_cache,
 )
 
 
+class _Box:
+    """Mutable, picklable argument that hashes by identity."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+async def _aiter(items: list[Any]) -> AsyncIterator[Any]:
+    """Yield *items* as an async iterator, like redis-py's ``*scan_iter``."""
+    for item in items:
+        yield item
+
+
 class TestEncodeDecode:
     """Tests for JSON encoding and decoding functions."""
 
+    @pytest.fixture(params=["orjson", "json"], autouse=True)
+    def json_backend(self, request: pytest.FixtureRequest):
+        """Run every test with orjson (when installed) and with stdlib json."""
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+            yield
+        else:
+            with patch("lambda_framework.cache._orjson", None):
+                yield
+
     def test_encode_string(self):
         """Should encode a string to JSON."""
-        assert _encode("hello") == '"hello"'
+        assert _encode("hello") == b'"hello"'
 
     def test_encode_int(self):
         """Should encode an integer to JSON."""
-        assert _encode(42) == "42"
+        assert _encode(42) == b"42"
 
     def test_encode_float(self):
         """Should encode a float to JSON."""
-        assert _encode(3.14) == "3.14"
+        assert _encode(3.14) == b"3.14"
 
     def test_encode_bool(self):
         """Should encode a boolean to JSON."""
-        assert _encode(True) == "true"
-        assert _encode(False) == "false"
+        assert _encode(True) == b"true"
+        assert _encode(False) == b"false"
 
     def test_encode_none(self):
         """Should encode None to JSON."""
-        assert _encode(None) == "null"
+        assert _encode(None) == b"null"
 
     def test_encode_list(self):
         """Should encode a list to JSON."""
-        assert _encode([1, 2, 3]) == "[1, 2, 3]"
+        assert _encode([1, 2, 3]) == b"[1,2,3]"
 
-    def test_encode_dict_with_sorted_keys(self):
-        """Should encode a dict with sorted keys."""
+    def test_encode_dict_compact_preserves_order(self):
+        """Should encode a dict compactly without sorting keys."""
         result = _encode({"b": 2, "a": 1})
-        assert result == '{"a": 1, "b": 2}'
+        assert result == b'{"b":2,"a":1}'
+
+    def test_encode_dict_with_non_string_keys(self):
+        """Should stringify non-string dict keys like stdlib json."""
+        assert _encode({1: "a"}) == b'{"1":"a"}'
 
     def test_decode_string(self):
         """Should decode a JSON string."""
-        assert _decode('"hello"') == "hello"
+        assert _decode(b'"hello"') == "hello"
 
     def test_decode_int(self):
         """Should decode a JSON integer."""
-        assert _decode("42") == 42
+        assert _decode(b"42") == 42
 
     def test_decode_dict(self):
         """Should decode a JSON object."""
-        assert _decode('{"a": 1, "b": 2}') == {"a": 1, "b": 2}
+        assert _decode(b'{"a": 1, "b": 2}') == {"a": 1, "b": 2}
+
+    def test_decode_str_input(self):
+        """Should also decode str input from decode_responses=True clients."""
+        assert _decode('{"a": 1}') == {"a": 1}
 
     def test_encode_decode_roundtrip(self):
         """Should roundtrip encode and decode."""
@@ -108,6 +152,79 @@ class TestDefaultKeyFunc:
         assert key1 != key2
 
 
+class TestHashArgs:
+    """Tests for the argument hashing helper."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [(), (1,), ("a", [1, 2], {"b": 2, "a": 1}), (None, True, 3.5)],
+    )
+    def test_positional_fast_path_matches_general_encoding(self, args):
+        """Kwargs-less calls should hash exactly like the general JSON form."""
+        key_data = json.dumps({"args": args, "kwargs": {}}, sort_keys=True)
+        expected = hashlib.blake2b(key_data.encode(), digest_size=8).hexdigest()
+        assert _hash_args(args, {}) == expected
+
+    def test_digest_stable_across_interpreters(self):
+        """Keys must match across processes regardless of PYTHONHASHSEED."""
+        code = (
+            "from lambda_framework.cache import _hash_args; "
+            "print(_hash_args(('repo', 42), {'page': 1}))"
+        )
+        digests = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                check=True,
+                capture_output=True,
+                text=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        assert digests == {_hash_args(("repo", 42), {"page": 1})}
+
+
+class TestHashArgsPickled:
+    """Tests for the pickle-based argument hashing used by fast_keys."""
+
+    def test_same_args_produce_same_digest(self):
+        """Equal arguments should hash the same, even as distinct objects."""
+        shared = "abc"
+        built = "".join(["ab", "c"])
+        assert _hash_args_pickled((shared, shared), {}) == _hash_args_pickled(
+            (shared, built), {}
+        )
+
+    def test_kwargs_order_does_not_matter(self):
+        """Keyword argument order should not affect the digest."""
+        assert _hash_args_pickled((), {"a": 1, "b": 2}) == _hash_args_pickled(
+            (), {"b": 2, "a": 1}
+        )
+
+    def test_distinguishes_equal_values_of_different_types(self):
+        """1, 1.0 and True should hash differently."""
+        digests = {_hash_args_pickled((value,), {}) for value in (1, 1.0, True)}
+        assert len(digests) == 3
+
+    def test_digest_stable_across_interpreters(self):
+        """Keys must match across processes regardless of PYTHONHASHSEED."""
+        code = (
+            "from lambda_framework.cache import _hash_args_pickled; "
+            "print(_hash_args_pickled(('repo', {'n': [1, 2]}), {'page': 1}))"
+        )
+        digests = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                check=True,
+                capture_output=True,
+                text=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        assert digests == {_hash_args_pickled(("repo", {"n": [1, 2]}), {"page": 1})}
+
+
 class TestCacheInfo:
     """Tests for the CacheInfo dataclass."""
 
@@ -125,20 +242,44 @@ class TestCacheInfo:
         assert info.misses == 5
         assert info.currsize == 15
 
+    def test_uses_slots(self):
+        """Should not carry a per-instance __dict__."""
+        info = CacheInfo()
+        assert not hasattr(info, "__dict__")
+        with pytest.raises(AttributeError):
+            info.maxsize = 1  # type: ignore[attr-defined]
+
 
 class TestAsyncRedisCacheUnit:
     """Unit tests for async_redis_cache decorator using mocks."""
 
     @pytest.fixture
-    def mock_redis(self):
+    def mock_pipeline(self):
+        """Create a mock Redis pipeline that queues commands synchronously."""
+        pipe = MagicMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        pipe.execute = AsyncMock(return_value=[True, 1, 0, True])
+        return pipe
+
+    @pytest.fixture
+    def mock_redis(self, mock_pipeline: MagicMock):
         """Create a mock async Redis client."""
         mock = AsyncMock()
         mock.get = AsyncMock(return_value=None)
-        mock.set = AsyncMock(return_value=True)
         mock.delete = AsyncMock(return_value=1)
+        mock.indexed_keys = []
+        mock.zscan_iter = MagicMock(
+            side_effect=lambda *args, **kwargs: _aiter(
+                [(key, 0.0) for key in mock.indexed_keys]
+            )
+        )
+        mock.pipeline = MagicMock(return_value=mock_pipeline)
         return mock
 
-    async def test_caches_function_result(self, mock_redis: AsyncMock):
+    async def test_caches_function_result(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
         """Should cache the result of the decorated function."""
         call_count = 0
 
@@ -152,7 +293,7 @@ class TestAsyncRedisCacheUnit:
         result1 = await expensive_func(5)
         assert result1 == 10
         assert call_count == 1
-        mock_redis.set.assert_called_once()
+        mock_pipeline.set.assert_called_once()
 
         # Simulate cache hit by returning cached value
         mock_redis.get.return_value = _encode(10)
@@ -162,7 +303,9 @@ class TestAsyncRedisCacheUnit:
         assert result2 == 10
         assert call_count == 1  # Function not called again
 
-    async def test_cache_miss_calls_function(self, mock_redis: AsyncMock):
+    async def test_cache_miss_calls_function(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
         """On cache miss, should call the function and cache result."""
 
         @async_redis_cache(redis=mock_redis, timeout=60)
@@ -173,9 +316,12 @@ class TestAsyncRedisCacheUnit:
 
         assert result == {"value": 42}
         mock_redis.get.assert_called_once()
-        mock_redis.set.assert_called_once()
+        mock_pipeline.set.assert_called_once()
+        mock_pipeline.execute.assert_awaited_once()
 
-    async def test_cache_hit_returns_cached_value(self, mock_redis: AsyncMock):
+    async def test_cache_hit_returns_cached_value(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
         """On cache hit, should return cached value without calling function."""
         mock_redis.get.return_value = _encode({"cached": True})
         call_count = 0
@@ -190,9 +336,11 @@ class TestAsyncRedisCacheUnit:
 
         assert result == {"cached": True}
         assert call_count == 0
-        mock_redis.set.assert_not_called()
+        mock_pipeline.set.assert_not_called()
 
-    async def test_timeout_passed_to_redis_set(self, mock_redis: AsyncMock):
+    async def test_timeout_passed_to_redis_set(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
         """Should pass timeout to Redis SET command."""
 
         @async_redis_cache(redis=mock_redis, timeout=3600)
@@ -202,10 +350,14 @@ class TestAsyncRedisCacheUnit:
         await func()
 
         # Check that set was called with ex=3600
-        call_args = mock_redis.set.call_args
+        call_args = mock_pipeline.set.call_args
         assert call_args.kwargs.get("ex") == 3600
+        # The key index is kept alive as long as its newest key
+        assert mock_pipeline.expire.call_args.args[1] == 3600
 
-    async def test_no_timeout_when_none(self, mock_redis: AsyncMock):
+    async def test_no_timeout_when_none(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
         """Should not set expiration when timeout is None."""
 
         @async_redis_cache(redis=mock_redis, timeout=None)
@@ -215,8 +367,10 @@ class TestAsyncRedisCacheUnit:
         await func()
 
         # Check that set was called without ex parameter
-        call_args = mock_redis.set.call_args
+        call_args = mock_pipeline.set.call_args
         assert "ex" not in call_args.kwargs or call_args.kwargs.get("ex") is None
+        mock_pipeline.expire.assert_not_called()
+        mock_pipeline.zremrangebyscore.assert_not_called()
 
     async def test_custom_key_func(self, mock_redis: AsyncMock):
         """Should use custom key function when provided."""
@@ -234,6 +388,128 @@ class TestAsyncRedisCacheUnit:
         call_args = mock_redis.get.call_args
         assert "custom:user:123" in call_args.args[0]
 
+    async def test_generated_keys_are_memoized(
+        self, mock_redis: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Repeated calls with the same arguments should reuse the default key."""
+        hash_calls = 0
+
+        def counting_hash_args(args, kwargs):
+            nonlocal hash_calls
+            hash_calls += 1
+            return _hash_args(args, kwargs)
+
+        monkeypatch.setattr("lambda_framework.cache._hash_args", counting_hash_args)
+
+        @async_redis_cache(redis=mock_redis)
+        async def get_user(user_id: int) -> dict:
+            return {"id": user_id}
+
+        await get_user(1)
+        await get_user(1)
+        await get_user(2)
+
+        assert hash_calls == 2
+
+    async def test_custom_key_func_not_memoized_by_default(self, mock_redis: AsyncMock):
+        """A custom key_func may be impure, so it runs on every call."""
+        tenant = "a"
+
+        def tenant_key_func(func, user_id: int) -> str:
+            return f"{tenant}:user:{user_id}"
+
+        @async_redis_cache(redis=mock_redis, key_func=tenant_key_func)
+        async def get_user(user_id: int) -> dict:
+            return {"id": user_id}
+
+        await get_user(1)
+        tenant = "b"
+        await get_user(1)
+
+        first, second = (c.args[0] for c in mock_redis.get.call_args_list)
+        assert (first, second) == ("a:user:1", "b:user:1")
+
+    async def test_custom_key_func_memoized_when_requested(self, mock_redis: AsyncMock):
+        """memoize_keys=True should opt a pure key_func into the memo."""
+        key_func_calls = 0
+
+        def my_key_func(func, user_id: int) -> str:
+            nonlocal key_func_calls
+            key_func_calls += 1
+            return f"user:{user_id}"
+
+        @async_redis_cache(redis=mock_redis, key_func=my_key_func, memoize_keys=True)
+        async def get_user(user_id: int) -> dict:
+            return {"id": user_id}
+
+        await get_user(1)
+        await get_user(1)
+        await get_user(2)
+
+        assert key_func_calls == 2
+
+    async def test_memoize_keys_disabled(self, mock_redis: AsyncMock):
+        """memoize_keys=False should generate the key on every call."""
+        key_func_calls = 0
+
+        def my_key_func(func, user_id: int) -> str:
+            nonlocal key_func_calls
+            key_func_calls += 1
+            return f"user:{user_id}"
+
+        @async_redis_cache(redis=mock_redis, key_func=my_key_func, memoize_keys=False)
+        async def get_user(user_id: int) -> dict:
+            return {"id": user_id}
+
+        await get_user(1)
+        await get_user(1)
+
+        assert key_func_calls == 2
+
+    async def test_memoized_keys_distinguish_equal_values_of_different_types(
+        self, mock_redis: AsyncMock
+    ):
+        """Values that compare equal but serialize differently get distinct keys."""
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: object) -> str:
+            return "value"
+
+        await func(1)
+        await func(True)
+
+        first, second = (c.args[0] for c in mock_redis.get.call_args_list)
+        assert first != second
+
+    async def test_memoized_keys_distinguish_nested_values_of_different_types(
+        self, mock_redis: AsyncMock
+    ):
+        """Equal containers whose items serialize differently get distinct keys."""
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: object) -> str:
+            return "value"
+
+        await func((1,))
+        await func((True,))
+        await func((1.0,))
+        await func(x=(1,))
+        await func(x=(True,))
+
+        keys = [c.args[0] for c in mock_redis.get.call_args_list]
+        assert len(set(keys[:3])) == 3
+        assert keys[3] != keys[4]
+
+    async def test_unhashable_args_bypass_key_memo(self, mock_redis: AsyncMock):
+        """Unhashable arguments should still produce a cache key."""
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(items: list[int]) -> int:
+            return sum(items)
+
+        assert await func([1, 2, 3]) == 6
+        mock_redis.get.assert_called_once()
+
     async def test_key_prefix(self, mock_redis: AsyncMock):
         """Should prepend key prefix when provided."""
 
@@ -246,6 +522,54 @@ class TestAsyncRedisCacheUnit:
         call_args = mock_redis.get.call_args
         assert call_args.args[0].startswith("myprefix:")
 
+    async def test_prefixed_key_matches_default_key_func(self, mock_redis: AsyncMock):
+        """Precomputed key prefix should yield the same key as _default_key_func."""
+
+        @async_redis_cache(redis=mock_redis, key="myprefix")
+        async def func(x: int, y: int = 0) -> int:
+            return x + y
+
+        await func(1, y=2)
+
+        expected = _default_key_func(func.__wrapped__, 1, y=2)  # type: ignore[attr-defined]
+        assert mock_redis.get.call_args.args[0] == f"myprefix:{expected}"
+
+    async def test_fast_keys_use_pickled_hash(self, mock_redis: AsyncMock):
+        """fast_keys should build keys from the pickle-based argument hash."""
+
+        @async_redis_cache(redis=mock_redis, key="myprefix", fast_keys=True)
+        async def func(x: int, y: int = 0) -> int:
+            return x + y
+
+        await func(1, y=2)
+
+        name = f"{func.__module__}:{func.__qualname__}"
+        digest = _hash_args_pickled((1,), {"y": 2})
+        assert mock_redis.get.call_args.args[0] == f"myprefix:{name}:{digest}"
+
+    async def test_fast_keys_follow_argument_mutation(self, mock_redis: AsyncMock):
+        """A mutated argument should get a new key rather than a memoized one."""
+
+        @async_redis_cache(redis=mock_redis, fast_keys=True)
+        async def func(box: _Box) -> int:
+            return box.value
+
+        box = _Box(1)
+        await func(box)
+        box.value = 2
+        await func(box)
+
+        first, second = (c.args[0] for c in mock_redis.get.call_args_list)
+        assert first != second
+        assert second.endswith(_hash_args_pickled((box,), {}))
+
+    def test_fast_keys_rejects_custom_key_func(self, mock_redis: AsyncMock):
+        """fast_keys has no effect on a custom key_func, so the combo is refused."""
+        with pytest.raises(ValueError, match="fast_keys cannot be used"):
+            async_redis_cache(
+                redis=mock_redis, fast_keys=True, key_func=lambda f, *a, **k: "k"
+            )
+
     async def test_cache_info_tracks_hits(self, mock_redis: AsyncMock):
         """cache_info should track cache hits."""
         mock_redis.get.return_value = _encode("cached")
@@ -288,8 +612,27 @@ class TestAsyncRedisCacheUnit:
         info = func.cache_info()  # type: ignore[attr-defined]
         assert info.currsize == 3
 
-    async def test_cache_clear_deletes_keys(self, mock_redis: AsyncMock):
-        """cache_clear should delete all tracked keys from Redis."""
+    async def test_keys_indexed_in_redis_sorted_set(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """Each stored key should be added to a per-function sorted set index."""
+
+        @async_redis_cache(redis=mock_redis, key="myprefix")
+        async def func(x: int) -> int:
+            return x
+
+        await func(1)
+
+        index_key, mapping = mock_pipeline.zadd.call_args.args
+        assert list(mapping) == [mock_pipeline.set.call_args.args[0]]
+        assert index_key.startswith(_INDEX_KEY_PREFIX)
+        assert not index_key.startswith("myprefix:")
+
+    async def test_cache_clear_deletes_keys(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """cache_clear should delete all indexed keys and the index from Redis."""
+        mock_redis.indexed_keys = [b"key-1", b"key-2"]
 
         @async_redis_cache(redis=mock_redis)
         async def func(x: int) -> int:
@@ -297,12 +640,49 @@ class TestAsyncRedisCacheUnit:
 
         await func(1)
         await func(2)
+        mock_pipeline.execute.reset_mock()
 
         await func.cache_clear()  # type: ignore[attr-defined]
 
-        mock_redis.delete.assert_called_once()
-        # Should have deleted 2 keys
-        assert len(mock_redis.delete.call_args.args) == 2
+        mock_redis.zscan_iter.assert_called_once()
+        index_key = mock_redis.zscan_iter.call_args.args[0]
+        # The 2 keys, then the index itself, in one pipelined round-trip
+        deleted = [c.args for c in mock_pipeline.unlink.call_args_list]
+        assert deleted == [(b"key-1", b"key-2"), (index_key,)]
+        mock_pipeline.execute.assert_awaited_once()
+        # Non-blocking UNLINK, never DEL
+        mock_pipeline.delete.assert_not_called()
+        mock_redis.delete.assert_not_called()
+
+    async def test_cache_clear_deletes_in_chunks(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """Large indexes should be deleted in bounded UNLINK batches."""
+        mock_redis.indexed_keys = [f"key-{i}".encode() for i in range(1200)]
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: int) -> int:
+            return x
+
+        await func.cache_clear()  # type: ignore[attr-defined]
+
+        sizes = [len(c.args) for c in mock_pipeline.unlink.call_args_list]
+        assert sizes == [500, 500, 200, 1]
+        mock_pipeline.execute.assert_awaited_once()
+
+    async def test_cache_clear_skips_delete_when_index_empty(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """cache_clear should not issue UNLINK when nothing has been indexed."""
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: int) -> int:
+            return x
+
+        await func.cache_clear()  # type: ignore[attr-defined]
+
+        mock_pipeline.unlink.assert_not_called()
+        mock_pipeline.execute.assert_not_awaited()
 
     async def test_cache_clear_resets_stats(self, mock_redis: AsyncMock):
         """cache_clear should reset cache statistics."""
@@ -335,11 +715,13 @@ class TestAsyncRedisCacheUnit:
 
         assert result == "fallback"
 
-    async def test_redis_set_error_gracefully_handled(self, mock_redis: AsyncMock):
+    async def test_redis_set_error_gracefully_handled(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
         """Redis SET errors should be handled gracefully."""
         from redis.exceptions import RedisError
 
-        mock_redis.set.side_effect = RedisError("Connection error")
+        mock_pipeline.execute.side_effect = RedisError("Connection error")
 
         @async_redis_cache(redis=mock_redis)
         async def func() -> str:
@@ -349,6 +731,355 @@ class TestAsyncRedisCacheUnit:
 
         assert result == "value"
 
+    async def test_concurrent_misses_call_function_once(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """Concurrent calls for the same key should share one lookup."""
+        call_count = 0
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: int) -> dict:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return {"value": x}
+
+        results = await asyncio.gather(func(1), func(1), func(1), func(2))
+
+        assert results == [{"value": 1}] * 3 + [{"value": 2}]
+        assert call_count == 2
+        assert mock_redis.get.await_count == 2
+        assert mock_pipeline.set.call_count == 2
+        # Waiters get their own decoded copy, like a cache hit
+        assert results[1] is not results[2]
+        info = func.cache_info()  # type: ignore[attr-defined]
+        assert info.misses == 2
+        assert info.hits == 2
+
+    async def test_concurrent_callers_share_exception(self, mock_redis: AsyncMock):
+        """Waiters should see the exception raised by the shared call."""
+        call_count = 0
+
+        @async_redis_cache(redis=mock_redis)
+        async def func() -> str:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(func(), func(), return_exceptions=True)
+
+        assert call_count == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        # The failure is not remembered
+        with pytest.raises(RuntimeError):
+            await func()
+        assert call_count == 2
+
+    async def test_waiter_retries_when_first_caller_cancelled(
+        self, mock_redis: AsyncMock
+    ):
+        """A waiter should run the lookup itself if the first caller is cancelled."""
+        call_count = 0
+
+        @async_redis_cache(redis=mock_redis)
+        async def func() -> str:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        first = asyncio.create_task(func())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(func())
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await waiter == "value"
+        assert first.cancelled()
+        assert call_count == 2
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(
+        self, mock_redis: AsyncMock
+    ):
+        """Cancelling a waiter should leave the first caller running."""
+
+        @async_redis_cache(redis=mock_redis)
+        async def func() -> str:
+            await asyncio.sleep(0.01)
+            return "value"
+
+        first = asyncio.create_task(func())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(func())
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        assert await first == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    async def test_msgpack_serializer_roundtrip(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """The msgpack serializer should store packed bytes and decode hits."""
+        ormsgpack = pytest.importorskip("ormsgpack")
+        value = {"embedding": [0.1, 0.2, 0.3], "blob": b"\x00\xff"}
+
+        @async_redis_cache(redis=mock_redis, serializer="msgpack")
+        async def func() -> dict:
+            return value
+
+        assert await func() == value
+        stored = mock_pipeline.set.call_args.args[1]
+        assert ormsgpack.unpackb(stored) == value
+
+        mock_redis.get.return_value = stored
+        assert await func() == value
+        assert func.cache_info().hits == 1  # type: ignore[attr-defined]
+
+    async def test_raw_serializer_passes_bytes_through(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """The raw serializer should store and return bytes untouched."""
+        body = b'{"pre":"rendered"}'
+
+        @async_redis_cache(redis=mock_redis, serializer="raw")
+        async def func() -> bytes:
+            return body
+
+        assert await func() is body
+        assert mock_pipeline.set.call_args.args[1] is body
+
+        mock_redis.get.return_value = body
+        assert await func() is body
+
+    async def test_raw_serializer_rejects_non_bytes(self, mock_redis: AsyncMock):
+        """The raw serializer should refuse results that are not bytes."""
+
+        @async_redis_cache(redis=mock_redis, serializer="raw")
+        async def func() -> dict:
+            return {"not": "bytes"}
+
+        with pytest.raises(TypeError, match="requires bytes, got dict"):
+            await func()
+
+    @pytest.mark.parametrize("serializer", ["json", "msgpack"])
+    async def test_compress_min_size_compresses_large_values(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock, serializer: str
+    ):
+        """Large values should be stored zstd-compressed and read back."""
+        zstandard = pytest.importorskip("zstandard")
+        if serializer == "msgpack":
+            pytest.importorskip("ormsgpack")
+        value = {"data": "x" * 2000}
+
+        @async_redis_cache(
+            redis=mock_redis, serializer=serializer, compress_min_size=512
+        )
+        async def func() -> dict:
+            return value
+
+        assert await func() == value
+        stored = mock_pipeline.set.call_args.args[1]
+        assert stored.startswith(b"\x28\xb5\x2f\xfd")
+        assert len(stored) < 100
+        assert zstandard.ZstdDecompressor().decompress(stored)
+
+        mock_redis.get.return_value = stored
+        assert await func() == value
+
+    async def test_compress_min_size_leaves_small_values_alone(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """Values under the threshold should be stored uncompressed."""
+        pytest.importorskip("zstandard")
+
+        @async_redis_cache(redis=mock_redis, compress_min_size=512)
+        async def func() -> dict:
+            return {"small": True}
+
+        await func()
+        stored = mock_pipeline.set.call_args.args[1]
+        assert stored == _encode({"small": True})
+
+        mock_redis.get.return_value = stored
+        assert await func() == {"small": True}
+
+    def test_compress_min_size_rejects_raw_serializer(self, mock_redis: AsyncMock):
+        """Compression cannot be combined with the raw serializer."""
+        with pytest.raises(ValueError, match="'raw' serializer"):
+            async_redis_cache(redis=mock_redis, serializer="raw", compress_min_size=1)
+
+    def test_compress_min_size_requires_zstandard(self, mock_redis: AsyncMock):
+        """Compression should raise ImportError without zstandard."""
+        with (
+            patch("lambda_framework.cache._zstd", None),
+            pytest.raises(ImportError, match="'zstd' optional dependency"),
+        ):
+            async_redis_cache(redis=mock_redis, compress_min_size=512)
+
+    def test_unknown_serializer_raises(self, mock_redis: AsyncMock):
+        """An unknown serializer name should be rejected at decoration time."""
+        with pytest.raises(ValueError, match="Unknown cache serializer: 'pickle'"):
+            async_redis_cache(redis=mock_redis, serializer="pickle")  # type: ignore[arg-type]
+
+    def test_msgpack_serializer_requires_ormsgpack(self, mock_redis: AsyncMock):
+        """The msgpack serializer should raise ImportError without ormsgpack."""
+        with (
+            patch("lambda_framework.cache._ormsgpack", None),
+            pytest.raises(ImportError, match="'msgpack' optional dependency"),
+        ):
+            async_redis_cache(redis=mock_redis, serializer="msgpack")
+
+    async def test_batch_get_uses_single_mget(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """batch_get should issue one MGET and store all misses in one pipeline."""
+        mock_redis.mget = AsyncMock(return_value=[_encode(10), None, None])
+        mock_pipeline.execute.return_value = [True, 1, 0, True] * 2
+        calls: list[int] = []
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: int) -> int:
+            calls.append(x)
+            return x * 10
+
+        results = await func.batch_get((1,), (2,), (3,))  # type: ignore[attr-defined]
+
+        assert results == [10, 20, 30]
+        assert sorted(calls) == [2, 3]
+        mock_redis.mget.assert_awaited_once()
+        mock_redis.get.assert_not_called()
+        assert mock_pipeline.set.call_count == 2
+        mock_pipeline.execute.assert_awaited_once()
+        info = func.cache_info()  # type: ignore[attr-defined]
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    async def test_batch_get_keys_match_single_calls(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """batch_get should use the same keys as calling the function directly."""
+        mock_redis.mget = AsyncMock(return_value=[None])
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: int) -> int:
+            return x
+
+        await func(7)
+        await func.batch_get((7,))  # type: ignore[attr-defined]
+
+        assert mock_redis.mget.call_args.args[0] == [mock_redis.get.call_args.args[0]]
+
+    async def test_batch_get_computes_duplicate_misses_once(
+        self, mock_redis: AsyncMock
+    ):
+        """Repeated arguments within one batch should share a single call."""
+        mock_redis.mget = AsyncMock(return_value=[None, None])
+        call_count = 0
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x
+
+        assert await func.batch_get((5,), (5,)) == [5, 5]  # type: ignore[attr-defined]
+        assert call_count == 1
+
+    async def test_batch_get_mget_error_gracefully_handled(self, mock_redis: AsyncMock):
+        """Redis MGET errors should fall back to calling the function."""
+        from redis.exceptions import RedisError
+
+        mock_redis.mget = AsyncMock(side_effect=RedisError("Connection error"))
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: int) -> int:
+            return x + 1
+
+        assert await func.batch_get((1,), (2,)) == [2, 3]  # type: ignore[attr-defined]
+
+    async def test_batch_get_empty(self, mock_redis: AsyncMock):
+        """An empty batch should not touch Redis."""
+
+        @async_redis_cache(redis=mock_redis)
+        async def func(x: int) -> int:
+            return x
+
+        assert await func.batch_get() == []  # type: ignore[attr-defined]
+        mock_redis.mget.assert_not_called()
+
+    async def test_refresh_ahead_refreshes_near_expiry_hit_in_background(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """A hit close to expiry should return at once and refresh later."""
+        # GET + PTTL for the lookup, then SET + SADD + EXPIRE for the refresh
+        mock_pipeline.execute.side_effect = [[_encode("old"), 5_000], [True, 0, True]]
+        refreshed = asyncio.Event()
+
+        @async_redis_cache(redis=mock_redis, timeout=60, refresh_ahead=10)
+        async def func() -> str:
+            refreshed.set()
+            return "new"
+
+        assert await func() == "old"
+        assert not refreshed.is_set()
+        mock_pipeline.pttl.assert_called_once()
+        mock_redis.get.assert_not_called()
+
+        await asyncio.wait_for(refreshed.wait(), timeout=1)
+        await asyncio.sleep(0)
+        assert mock_pipeline.set.call_args.args == (
+            mock_pipeline.get.call_args.args[0],
+            _encode("new"),
+        )
+        info = func.cache_info()  # type: ignore[attr-defined]
+        assert (info.hits, info.misses) == (1, 0)
+
+    async def test_refresh_ahead_skips_fresh_hits(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """A hit with plenty of TTL left should not trigger a refresh."""
+        mock_pipeline.execute.return_value = [_encode("cached"), 50_000]
+        call_count = 0
+
+        @async_redis_cache(redis=mock_redis, timeout=60, refresh_ahead=10)
+        async def func() -> str:
+            nonlocal call_count
+            call_count += 1
+            return "new"
+
+        assert await func() == "cached"
+        await asyncio.sleep(0)
+        assert call_count == 0
+        mock_pipeline.set.assert_not_called()
+
+    def test_refresh_ahead_dropped_when_invocation_loop_closes(
+        self, mock_redis: AsyncMock, mock_pipeline: MagicMock
+    ):
+        """A refresh still pending when asyncio.run returns is cancelled."""
+        mock_pipeline.execute.side_effect = [[_encode("old"), 5_000]]
+        finished = False
+
+        @async_redis_cache(redis=mock_redis, timeout=60, refresh_ahead=10)
+        async def func() -> str:
+            nonlocal finished
+            await asyncio.sleep(1)
+            finished = True
+            return "new"
+
+        # One Lambda invocation, as run by create_dispatcher/EventBridgeRouter
+        assert asyncio.run(func()) == "old"
+
+        assert finished is False
+        mock_pipeline.set.assert_not_called()
+
+    def test_refresh_ahead_requires_timeout(self, mock_redis: AsyncMock):
+        """refresh_ahead without a TTL should be rejected at decoration time."""
+        with pytest.raises(ValueError, match="refresh_ahead requires a timeout"):
+            async_redis_cache(redis=mock_redis, timeout=None, refresh_ahead=10)
+
     async def test_raises_error_when_no_redis_provided(self):
         """Should raise ValueError when no redis or redis_url provided."""
 
@@ -359,15 +1090,18 @@ class TestAsyncRedisCacheUnit:
         with pytest.raises(ValueError, match="Either 'redis' or 'redis_url'"):
             await func()
 
-    async def test_lazy_redis_creation_from_url(self):
-        """Should create Redis client lazily from URL."""
+    async def test_redis_creation_from_url(self, mock_pipeline: MagicMock):
+        """Should create Redis client from URL."""
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=None)
-        mock_client.set = AsyncMock(return_value=True)
+        mock_client.pipeline = MagicMock(return_value=mock_pipeline)
 
-        with patch(
-            "lambda_framework.cache.AIORedis.from_url", return_value=mock_client
-        ) as mock_from_url:
+        with (
+            patch.dict("lambda_framework.cache._CLIENTS", clear=True),
+            patch(
+                "lambda_framework.cache.AIORedis.from_url", return_value=mock_client
+            ) as mock_from_url,
+        ):
 
             @async_redis_cache(redis_url="redis://localhost:6379")
             async def func() -> str:
@@ -376,6 +1110,53 @@ class TestAsyncRedisCacheUnit:
             await func()
 
             mock_from_url.assert_called_once_with("redis://localhost:6379")
+            mock_client.get.assert_awaited_once()
+
+    async def test_redis_client_shared_per_url(self, mock_pipeline: MagicMock):
+        """Decorators bound to the same URL should share one Redis client."""
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=None)
+        mock_client.pipeline = MagicMock(return_value=mock_pipeline)
+
+        with (
+            patch.dict("lambda_framework.cache._CLIENTS", clear=True),
+            patch(
+                "lambda_framework.cache.AIORedis.from_url", return_value=mock_client
+            ) as mock_from_url,
+        ):
+
+            @async_redis_cache(redis_url="redis://localhost:6379")
+            async def func_a() -> str:
+                return "a"
+
+            @async_redis_cache(redis_url="redis://localhost:6379")
+            async def func_b() -> str:
+                return "b"
+
+            await func_a()
+            await func_b()
+
+            mock_from_url.assert_called_once_with("redis://localhost:6379")
+            assert mock_client.get.await_count == 2
+
+    async def test_wrapper_is_coroutine_function(self, mock_redis: AsyncMock):
+        """Decorated functions should still be detected as coroutine functions."""
+
+        @async_redis_cache(redis=mock_redis)
+        async def func() -> str:
+            return "value"
+
+        assert inspect.iscoroutinefunction(func)
+
+    async def test_decorates_methods(self, mock_redis: AsyncMock):
+        """Decorated methods should bind ``self`` like regular functions."""
+
+        class Service:
+            @async_redis_cache(redis=mock_redis, key_func=lambda fn, svc, x: str(x))
+            async def double(self, x: int) -> int:
+                return x * 2
+
+        assert await Service().double(21) == 42
 
     async def test_preserves_function_metadata(self, mock_redis: AsyncMock):
         """Decorator should preserve function metadata."""
@@ -387,3 +1168,87 @@ class TestAsyncRedisCacheUnit:
 
         assert my_documented_func.__name__ == "my_documented_func"
         assert my_documented_func.__doc__ == "Return a test value."
+
+
+class TestKeyIndexExpiry:
+    """Tests for the expiry-scored key index against an in-memory Redis."""
+
+    @pytest.fixture
+    def redis(self):
+        """Create a fake async Redis client."""
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeAsyncRedis()
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        """Drive the wall clock the cache scores index members with."""
+        now = [1_000_000.0]
+        monkeypatch.setattr(
+            "lambda_framework.cache.time", types.SimpleNamespace(time=lambda: now[0])
+        )
+        return now
+
+    async def test_members_scored_by_expiry(self, redis: Any, clock: list[float]):
+        """Each indexed key should be scored with the time its value expires."""
+
+        @async_redis_cache(redis=redis, timeout=60)
+        async def func(x: int) -> int:
+            return x
+
+        await func(1)
+
+        (index_key,) = await redis.keys(f"{_INDEX_KEY_PREFIX}*")
+        [(_, score)] = await redis.zrange(index_key, 0, -1, withscores=True)
+        assert score == clock[0] + 60
+
+    async def test_expired_members_pruned_on_write(
+        self, redis: Any, clock: list[float]
+    ):
+        """A write should drop index members whose keys have already expired."""
+
+        @async_redis_cache(redis=redis, timeout=60)
+        async def func(x: int) -> int:
+            return x
+
+        for x in range(3):
+            await func(x)
+        (index_key,) = await redis.keys(f"{_INDEX_KEY_PREFIX}*")
+        assert await redis.zcard(index_key) == 3
+
+        # The first three entries have expired by the time the next is written
+        clock[0] += 61
+        await func(3)
+
+        assert await redis.zcard(index_key) == 1
+
+    async def test_entries_without_timeout_never_pruned(
+        self, redis: Any, clock: list[float]
+    ):
+        """Keys stored without a timeout should stay indexed indefinitely."""
+
+        @async_redis_cache(redis=redis, timeout=None)
+        async def func(x: int) -> int:
+            return x
+
+        await func(1)
+        clock[0] += 10**9
+        await func(2)
+
+        (index_key,) = await redis.keys(f"{_INDEX_KEY_PREFIX}*")
+        assert await redis.zcard(index_key) == 2
+        assert await redis.ttl(index_key) == -1
+
+    async def test_cache_clear_deletes_indexed_keys(
+        self, redis: Any, clock: list[float]
+    ):
+        """cache_clear should remove every cached value and the index itself."""
+
+        @async_redis_cache(redis=redis, timeout=60)
+        async def func(x: int) -> int:
+            return x
+
+        await func(1)
+        await func(2)
+        await func.cache_clear()  # type: ignore[attr-defined]
+
+        assert await redis.keys("*") == []
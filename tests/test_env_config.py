@@ -1,41 +1,128 @@
 """Unit tests for the env_config module."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+import botocore.session
 import pytest
-from aws_secretsmanager_caching import SecretCacheConfig
-
-from lambda_framework.env_config import EnvConfigBase
+from aws_secretsmanager_caching import SecretCache, SecretCacheConfig
+
+from lambda_framework.env_config import (
+    _PARSED_SECRETS,
+    _SECRET_CACHES,
+    EnvConfigBase,
+    _secrets_client,
+)
+
+# Secret strings returned by the mocked SecretCache, encoded once per run
+_SECRETS_OK = json.dumps(
+    {"MY_SECRET": "aws-secret-value", "OTHER_SECRET": "other-value"}
+)
+_SECRETS_MISSING = json.dumps({"OTHER_SECRET": "other-value"})
+_SECRETS_NUMERIC = json.dumps({"NUMERIC_SECRET": 12345})
+
+# Shared across tests; _reset_shared_secrets_state drops the SecretCache keyed
+# by it between tests
+_CUSTOM_CACHE_CONFIG = SecretCacheConfig(max_cache_size=100)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_secrets_state():
+    """Drop the process-wide Secrets Manager client and caches between tests."""
+    _secrets_client.cache_clear()
+    _SECRET_CACHES.clear()
+    _PARSED_SECRETS.clear()
+    yield
+    _secrets_client.cache_clear()
+    _SECRET_CACHES.clear()
+    _PARSED_SECRETS.clear()
+
+
+@pytest.fixture
+def mock_session(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Make botocore hand out a mock session with a mock Secrets Manager client."""
+    session = MagicMock(spec=botocore.session.Session)
+    # List specs keep the mocks from growing attributes the code never uses
+    session.create_client.return_value = MagicMock(
+        spec=["get_secret_value", "describe_secret"]
+    )
+    monkeypatch.setattr(
+        "lambda_framework.env_config.botocore.session.get_session", lambda: session
+    )
+    return session
+
+
+@pytest.fixture
+def mock_secret_cache_class(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace SecretCache with a mock that builds a fresh mock per call."""
+    secret_cache_class = MagicMock(
+        side_effect=lambda *args: MagicMock(spec=SecretCache)
+    )
+    monkeypatch.setattr("lambda_framework.env_config.SecretCache", secret_cache_class)
+    return secret_cache_class
+
+
+@pytest.fixture
+def aws_config(mock_session: MagicMock) -> EnvConfigBase:
+    """Build an EnvConfigBase in AWS mode backed by the mock session."""
+    return EnvConfigBase(
+        env="prod", load_local_secrets_env="dev", aws_secret_name="my-aws-secret"
+    )
 
 
 class TestEnvConfigBaseInit:
     """Tests for EnvConfigBase initialization."""
 
-    @patch("lambda_framework.env_config.botocore.session.get_session")
-    def test_init_local_mode_does_not_create_cache(self, mock_get_session: MagicMock):
+    def test_init_local_mode_does_not_create_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
         """When env matches load_local_secrets_env, no secret cache should be created."""
+        mock_get_session = MagicMock(spec=botocore.session.get_session)
+        monkeypatch.setattr(
+            "lambda_framework.env_config.botocore.session.get_session",
+            mock_get_session,
+        )
         config = EnvConfigBase(env="dev", load_local_secrets_env="dev")
 
         assert config._secret_cache is None
         mock_get_session.assert_not_called()
 
-    @patch("lambda_framework.env_config.botocore.session.get_session")
-    def test_init_aws_mode_creates_cache(self, mock_get_session: MagicMock):
+    def test_init_aws_mode_creates_cache(
+        self, aws_config: EnvConfigBase, mock_session: MagicMock
+    ):
         """When env doesn't match load_local_secrets_env, secret cache should be created."""
-        mock_session = MagicMock()
-        mock_client = MagicMock()
-        mock_session.create_client.return_value = mock_client
-        mock_get_session.return_value = mock_session
+        assert aws_config._secret_cache is not None
+        mock_session.create_client.assert_called_once_with("secretsmanager")
 
-        config = EnvConfigBase(
-            env="prod", load_local_secrets_env="dev", aws_secret_name="my-secret"
-        )
+    def test_init_aws_mode_shares_secrets_client(self, mock_session: MagicMock):
+        """Multiple instances should share one botocore session and client."""
+        EnvConfigBase(env="prod", load_local_secrets_env="dev", aws_secret_name="a")
+        EnvConfigBase(env="prod", load_local_secrets_env="dev", aws_secret_name="b")
 
-        assert config._secret_cache is not None
-        mock_get_session.assert_called_once()
         mock_session.create_client.assert_called_once_with("secretsmanager")
 
+    @pytest.mark.usefixtures("mock_session")
+    def test_init_aws_mode_shares_secret_cache_per_config(
+        self, mock_secret_cache_class: MagicMock
+    ):
+        """Instances with the same cache config should share one SecretCache."""
+        default_a = EnvConfigBase(
+            env="prod", load_local_secrets_env="dev", aws_secret_name="a"
+        )
+        default_b = EnvConfigBase(
+            env="prod", load_local_secrets_env="dev", aws_secret_name="b"
+        )
+        custom = EnvConfigBase(
+            env="prod",
+            load_local_secrets_env="dev",
+            aws_secret_name="a",
+            secrets_cache_config=_CUSTOM_CACHE_CONFIG,
+        )
+
+        assert default_a.secret_cache is default_b.secret_cache
+        assert custom.secret_cache is not default_a.secret_cache
+        assert mock_secret_cache_class.call_count == 2
+
     def test_init_aws_mode_without_secret_name_raises_error(self):
         """When env doesn't match and aws_secret_name is not provided, should raise ValueError."""
         with pytest.raises(
@@ -46,27 +133,22 @@ class TestEnvConfigBaseInit:
                 env="prod", load_local_secrets_env="dev", aws_secret_name=None
             )
 
-    @patch("lambda_framework.env_config.SecretCache")
-    @patch("lambda_framework.env_config.botocore.session.get_session")
     def test_init_with_custom_cache_config(
-        self, mock_get_session: MagicMock, mock_secret_cache_class: MagicMock
+        self, mock_session: MagicMock, mock_secret_cache_class: MagicMock
     ):
         """Custom SecretCacheConfig should be passed to SecretCache."""
-        mock_session = MagicMock()
-        mock_client = MagicMock()
-        mock_session.create_client.return_value = mock_client
-        mock_get_session.return_value = mock_session
-
-        custom_config = SecretCacheConfig(max_cache_size=100)
+        mock_client = mock_session.create_client.return_value
 
         EnvConfigBase(
             env="prod",
             load_local_secrets_env="dev",
             aws_secret_name="my-secret",
-            secrets_cache_config=custom_config,
+            secrets_cache_config=_CUSTOM_CACHE_CONFIG,
         )
 
-        mock_secret_cache_class.assert_called_once_with(custom_config, mock_client)
+        mock_secret_cache_class.assert_called_once_with(
+            _CUSTOM_CACHE_CONFIG, mock_client
+        )
 
 
 class TestLoadLocalSecrets:
@@ -85,19 +167,9 @@ class TestLoadLocalSecrets:
         config2 = EnvConfigBase(env="dev", load_local_secrets_env="DEV")
         assert config2.load_local_secrets is True
 
-    @patch("lambda_framework.env_config.botocore.session.get_session")
-    def test_load_local_secrets_false_when_env_differs(
-        self, mock_get_session: MagicMock
-    ):
+    def test_load_local_secrets_false_when_env_differs(self, aws_config: EnvConfigBase):
         """Should return False when env doesn't match load_local_secrets_env."""
-        mock_session = MagicMock()
-        mock_session.create_client.return_value = MagicMock()
-        mock_get_session.return_value = mock_session
-
-        config = EnvConfigBase(
-            env="prod", load_local_secrets_env="dev", aws_secret_name="my-secret"
-        )
-        assert config.load_local_secrets is False
+        assert aws_config.load_local_secrets is False
 
 
 class TestSecretCacheProperty:
@@ -108,34 +180,30 @@ class TestSecretCacheProperty:
         config = EnvConfigBase(env="dev", load_local_secrets_env="dev")
         assert config.secret_cache is None
 
-    @patch("lambda_framework.env_config.botocore.session.get_session")
-    def test_secret_cache_is_set_in_aws_mode(self, mock_get_session: MagicMock):
+    def test_secret_cache_is_set_in_aws_mode(self, aws_config: EnvConfigBase):
         """Secret cache should be set when in AWS mode."""
-        mock_session = MagicMock()
-        mock_session.create_client.return_value = MagicMock()
-        mock_get_session.return_value = mock_session
-
-        config = EnvConfigBase(
-            env="prod", load_local_secrets_env="dev", aws_secret_name="my-secret"
-        )
-        assert config.secret_cache is not None
+        assert aws_config.secret_cache is not None
 
 
 class TestGetSecret:
     """Tests for the get_secret method."""
 
-    @patch.dict("os.environ", {"MY_SECRET": "secret-value"})
-    def test_get_secret_local_mode_returns_env_var(self):
+    def test_get_secret_local_mode_returns_env_var(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
         """In local mode, should return the value from environment variable."""
+        monkeypatch.setenv("MY_SECRET", "secret-value")
         config = EnvConfigBase(env="dev", load_local_secrets_env="dev")
 
         result = config.get_secret("MY_SECRET")
 
         assert result == "secret-value"
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_get_secret_local_mode_raises_when_env_var_missing(self):
+    def test_get_secret_local_mode_raises_when_env_var_missing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
         """In local mode, should raise ValueError when env var is not set."""
+        monkeypatch.delenv("MISSING_SECRET", raising=False)
         config = EnvConfigBase(env="dev", load_local_secrets_env="dev")
 
         with pytest.raises(
@@ -144,51 +212,43 @@ class TestGetSecret:
         ):
             config.get_secret("MISSING_SECRET")
 
-    @patch("lambda_framework.env_config.botocore.session.get_session")
+    @pytest.mark.parametrize(
+        ("secret_string", "name", "expected"),
+        [
+            pytest.param(_SECRETS_OK, "MY_SECRET", "aws-secret-value", id="string"),
+            pytest.param(_SECRETS_NUMERIC, "NUMERIC_SECRET", "12345", id="non-string"),
+        ],
+    )
     def test_get_secret_aws_mode_returns_secret_from_cache(
-        self, mock_get_session: MagicMock
+        self,
+        aws_config: EnvConfigBase,
+        secret_string: str,
+        name: str,
+        expected: str,
     ):
-        """In AWS mode, should return the secret from the cache."""
-        mock_session = MagicMock()
-        mock_client = MagicMock()
-        mock_session.create_client.return_value = mock_client
-        mock_get_session.return_value = mock_session
-
-        config = EnvConfigBase(
-            env="prod", load_local_secrets_env="dev", aws_secret_name="my-aws-secret"
-        )
+        """In AWS mode, should return the secret from the cache as a string."""
+        config = aws_config
 
         # Mock the secret cache response
-        secrets_data = {"MY_SECRET": "aws-secret-value", "OTHER_SECRET": "other-value"}
         assert config._secret_cache is not None
-        config._secret_cache.get_secret_string = MagicMock(
-            return_value=json.dumps(secrets_data)
-        )
+        config._secret_cache.get_secret_string = MagicMock(return_value=secret_string)
 
-        result = config.get_secret("MY_SECRET")
+        result = config.get_secret(name)
 
-        assert result == "aws-secret-value"
+        assert result == expected
+        assert isinstance(result, str)
         config._secret_cache.get_secret_string.assert_called_once_with("my-aws-secret")
 
-    @patch("lambda_framework.env_config.botocore.session.get_session")
     def test_get_secret_aws_mode_raises_when_secret_missing(
-        self, mock_get_session: MagicMock
+        self, aws_config: EnvConfigBase
     ):
         """In AWS mode, should raise ValueError when secret is not in cache."""
-        mock_session = MagicMock()
-        mock_client = MagicMock()
-        mock_session.create_client.return_value = mock_client
-        mock_get_session.return_value = mock_session
-
-        config = EnvConfigBase(
-            env="prod", load_local_secrets_env="dev", aws_secret_name="my-aws-secret"
-        )
+        config = aws_config
 
         # Mock the secret cache response without the requested secret
-        secrets_data = {"OTHER_SECRET": "other-value"}
         assert config._secret_cache is not None
         config._secret_cache.get_secret_string = MagicMock(
-            return_value=json.dumps(secrets_data)
+            return_value=_SECRETS_MISSING
         )
 
         with pytest.raises(
@@ -197,31 +257,53 @@ class TestGetSecret:
         ):
             config.get_secret("MISSING_SECRET")
 
-    @patch("lambda_framework.env_config.botocore.session.get_session")
-    def test_get_secret_aws_mode_converts_non_string_to_string(
-        self, mock_get_session: MagicMock
+    def test_get_secret_aws_mode_without_orjson(
+        self, aws_config: EnvConfigBase, monkeypatch: pytest.MonkeyPatch
     ):
-        """In AWS mode, should convert non-string secret values to strings."""
-        mock_session = MagicMock()
-        mock_client = MagicMock()
-        mock_session.create_client.return_value = mock_client
-        mock_get_session.return_value = mock_session
+        """In AWS mode, should fall back to stdlib json when orjson is missing."""
+        monkeypatch.setattr("lambda_framework.env_config._orjson", None)
+        config = aws_config
+        assert config._secret_cache is not None
+        config._secret_cache.get_secret_string = MagicMock(return_value=_SECRETS_OK)
+
+        assert config.get_secret("MY_SECRET") == "aws-secret-value"
 
-        config = EnvConfigBase(
+    def test_get_secret_aws_mode_shares_parsed_secrets(
+        self, aws_config: EnvConfigBase, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Instances reading the same secret should only parse it once."""
+        mock_loads = MagicMock(side_effect=json.loads)
+        monkeypatch.setattr("lambda_framework.env_config._loads", mock_loads)
+
+        first = aws_config
+        second = EnvConfigBase(
             env="prod", load_local_secrets_env="dev", aws_secret_name="my-aws-secret"
         )
+        assert first._secret_cache is not None
+        first._secret_cache.get_secret_string = MagicMock(return_value=_SECRETS_OK)
 
-        # Mock the secret cache response with a numeric value
-        secrets_data = {"NUMERIC_SECRET": 12345}
-        assert config._secret_cache is not None
-        config._secret_cache.get_secret_string = MagicMock(
-            return_value=json.dumps(secrets_data)
-        )
+        assert first.get_secret("MY_SECRET") == "aws-secret-value"
+        assert second.get_secret("MY_SECRET") == "aws-secret-value"
+        mock_loads.assert_called_once()
 
-        result = config.get_secret("NUMERIC_SECRET")
+    def test_get_secret_aws_mode_reparses_rotated_secret(
+        self, aws_config: EnvConfigBase
+    ):
+        """A changed secret string should be re-parsed for new instances."""
+        first = aws_config
+        assert first._secret_cache is not None
+        first._secret_cache.get_secret_string = MagicMock(
+            return_value=json.dumps({"MY_SECRET": "old"})
+        )
+        assert first.get_secret("MY_SECRET") == "old"
 
-        assert result == "12345"
-        assert isinstance(result, str)
+        first._secret_cache.get_secret_string.return_value = json.dumps(
+            {"MY_SECRET": "new"}
+        )
+        second = EnvConfigBase(
+            env="prod", load_local_secrets_env="dev", aws_secret_name="my-aws-secret"
+        )
+        assert second.get_secret("MY_SECRET") == "new"
 
     def test_get_secret_raises_when_cache_is_none_unexpectedly(self):
         """Should raise ValueError if cache is None when trying to get secret from AWS."""
@@ -0,0 +1,255 @@
+"""Unit tests for the GitHub rate limiter module."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+try:
+    import fakeredis
+    import pottery_semaphore  # noqa: F401
+except ImportError:
+    pytest.skip(
+        "fakeredis and pottery-semaphore are not installed", allow_module_level=True
+    )
+
+from lambda_framework.github import LambdaThrottler
+
+_URL = "https://api.github.com/repos/o/r/issues"
+
+
+def _throttler(server: fakeredis.FakeServer, **kwargs) -> LambdaThrottler:
+    """Build a throttler whose sync and async clients share one fake server."""
+    return LambdaThrottler(
+        max_concurrency=2,
+        valkey=fakeredis.FakeRedis(server=server),
+        aiovalkey=fakeredis.FakeAsyncRedis(server=server),
+        **kwargs,
+    )
+
+
+def _reserve(throttler: LambdaThrottler) -> int:
+    """Reserve one mutating slot and return the wait in milliseconds."""
+    return throttler.pace_script(
+        keys=[throttler._pace_key], args=throttler._pace_args()
+    )
+
+
+@pytest.fixture
+def server() -> fakeredis.FakeServer:
+    """Fresh in-memory Redis server with Lua scripting."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record every time.sleep/asyncio.sleep delay while still sleeping."""
+    recorded: list[float] = []
+    real_sleep, real_async_sleep = time.sleep, asyncio.sleep
+
+    def recording_sleep(delay: float) -> None:
+        recorded.append(delay)
+        real_sleep(delay)
+
+    async def recording_async_sleep(delay: float, *args, **kwargs):
+        recorded.append(delay)
+        return await real_async_sleep(delay, *args, **kwargs)
+
+    monkeypatch.setattr(time, "sleep", recording_sleep)
+    monkeypatch.setattr(asyncio, "sleep", recording_async_sleep)
+    return recorded
+
+
+class TestLambdaThrottlerInit:
+    """Tests for LambdaThrottler argument validation."""
+
+    @pytest.mark.parametrize("burst", [0, -1])
+    def test_rejects_burst_below_one(self, burst: int):
+        """A burst below 1 has no meaning for the token bucket."""
+        with pytest.raises(ValueError, match="mutating_burst must be at least 1"):
+            LambdaThrottler(max_concurrency=1, mutating_burst=burst)
+
+    def test_rejects_negative_local_read_slack(self):
+        """A negative slack would be silently treated as disabled."""
+        with pytest.raises(ValueError, match="local_read_slack must not be negative"):
+            LambdaThrottler(max_concurrency=1, local_read_slack=-1)
+
+
+class TestPaceScript:
+    """Tests for the Redis-side GCRA token bucket."""
+
+    def test_first_mutating_call_does_not_wait(self, server):
+        """An empty bucket should let the first mutating request through."""
+        assert _reserve(_throttler(server)) == 0
+
+    def test_calls_spaced_by_interval(self, server):
+        """Back-to-back reservations should wait one more interval each."""
+        throttler = _throttler(server, mutating_sleep_seconds=1.0)
+
+        first, second, third = (_reserve(throttler) for _ in range(3))
+
+        assert first == 0
+        assert 900 < second <= 1000
+        assert 1900 < third <= 2000
+
+    def test_burst_allows_back_to_back_calls(self, server):
+        """With a burst of 3, only the fourth reservation has to wait."""
+        throttler = _throttler(server, mutating_sleep_seconds=1.0, mutating_burst=3)
+
+        waits = [_reserve(throttler) for _ in range(4)]
+
+        assert waits[:3] == [0, 0, 0]
+        assert 900 < waits[3] <= 1000
+
+    def test_bucket_shared_across_throttlers(self, server):
+        """Instances using the same throttle key should pace each other."""
+        assert _reserve(_throttler(server)) == 0
+        assert _reserve(_throttler(server)) > 900
+
+    async def test_async_script_matches_sync(self, server):
+        """The async script should reserve from the same bucket."""
+        throttler = _throttler(server, mutating_sleep_seconds=1.0)
+        reserve = throttler.async_pace_script
+
+        first = await reserve(keys=[throttler._pace_key], args=throttler._pace_args())
+        second = _reserve(throttler)
+
+        assert first == 0
+        assert 900 < second <= 1000
+
+
+class TestMutatingPacing:
+    """Tests for how acquire/async_acquire apply the token bucket."""
+
+    def test_acquire_sleeps_only_when_bucket_requires(self, server, sleeps):
+        """The first POST goes straight through; the next waits an interval."""
+        throttler = _throttler(server, mutating_sleep_seconds=0.1)
+        throttler._semaphore = MagicMock()
+        request = httpx.Request("POST", _URL)
+
+        with throttler.acquire(request):
+            pass
+        assert sleeps == []
+        with throttler.acquire(request):
+            pass
+
+        assert len(sleeps) == 1
+        assert 0.05 < sleeps[0] <= 0.1
+
+    async def test_async_acquire_sleeps_only_when_bucket_requires(self, server, sleeps):
+        """The async path should pace mutating requests the same way."""
+        throttler = _throttler(server, mutating_sleep_seconds=0.1)
+        throttler._async_semaphore = MagicMock()
+        request = httpx.Request("PATCH", _URL)
+
+        async with throttler.async_acquire(request):
+            pass
+        async with throttler.async_acquire(request):
+            pass
+
+        assert len(sleeps) == 1
+        assert 0.05 < sleeps[0] <= 0.1
+
+    def test_zero_interval_disables_pacing(self, server, sleeps):
+        """mutating_sleep_seconds=0 should never call the script."""
+        throttler = _throttler(server, mutating_sleep_seconds=0)
+        throttler._semaphore = MagicMock()
+        throttler._pace_script = MagicMock()
+
+        for _ in range(3):
+            with throttler.acquire(httpx.Request("POST", _URL)):
+                pass
+
+        throttler._pace_script.assert_not_called()
+        assert sleeps == []
+
+    @pytest.mark.parametrize("method", ["GET", "HEAD", "OPTIONS"])
+    async def test_non_mutating_requests_skip_script(self, server, method: str):
+        """Reads should only take the semaphore, never a bucket token."""
+        throttler = _throttler(server)
+        throttler._semaphore = MagicMock()
+        throttler._async_semaphore = MagicMock()
+        throttler._pace_script = MagicMock()
+        throttler._async_pace_script = MagicMock()
+        request = httpx.Request(method, _URL)
+
+        with throttler.acquire(request):
+            pass
+        async with throttler.async_acquire(request):
+            pass
+
+        throttler._pace_script.assert_not_called()
+        throttler._async_pace_script.assert_not_called()
+        throttler._semaphore.__enter__.assert_called_once()
+        throttler._async_semaphore.__aenter__.assert_called_once()
+
+
+class TestLocalReadSlack:
+    """Tests for the per-instance fast path that lets reads skip the semaphore."""
+
+    @staticmethod
+    def _slack_throttler(server, slack: int) -> LambdaThrottler:
+        """Build an unpaced throttler with mocked semaphores and *slack* slots."""
+        throttler = _throttler(server, local_read_slack=slack, mutating_sleep_seconds=0)
+        throttler._semaphore = MagicMock()
+        throttler._async_semaphore = MagicMock()
+        return throttler
+
+    def test_read_takes_and_returns_slot(self, server):
+        """A read inside the slack holds a local slot, not the semaphore."""
+        throttler = self._slack_throttler(server, slack=1)
+
+        with throttler.acquire(httpx.Request("GET", _URL)):
+            assert throttler._local_inflight == 1
+
+        assert throttler._local_inflight == 0
+        throttler._semaphore.__enter__.assert_not_called()
+
+    async def test_slot_returned_when_request_raises(self, server):
+        """The slot must be released even if the request fails."""
+        throttler = self._slack_throttler(server, slack=1)
+
+        with (
+            pytest.raises(httpx.ConnectError),
+            throttler.acquire(httpx.Request("GET", _URL)),
+        ):
+            raise httpx.ConnectError("boom")
+        with pytest.raises(httpx.ConnectError):
+            async with throttler.async_acquire(httpx.Request("GET", _URL)):
+                raise httpx.ConnectError("boom")
+
+        assert throttler._local_inflight == 0
+
+    def test_exhausted_slack_falls_back_to_semaphore(self, server):
+        """Reads beyond the slack should take the distributed semaphore."""
+        throttler = self._slack_throttler(server, slack=1)
+        request = httpx.Request("GET", _URL)
+
+        with throttler.acquire(request), throttler.acquire(request):
+            assert throttler._local_inflight == 1
+            throttler._semaphore.__enter__.assert_called_once()
+
+        assert throttler._local_inflight == 0
+
+    async def test_async_exhausted_slack_falls_back_to_semaphore(self, server):
+        """The async path should share the same local slots."""
+        throttler = self._slack_throttler(server, slack=1)
+        request = httpx.Request("GET", _URL)
+
+        async with throttler.async_acquire(request), throttler.async_acquire(request):
+            assert throttler._local_inflight == 1
+            throttler._async_semaphore.__aenter__.assert_called_once()
+
+        assert throttler._local_inflight == 0
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE"])
+    def test_mutating_requests_never_take_fast_path(self, server, method: str):
+        """Writes should always take the semaphore, even with free slack."""
+        throttler = self._slack_throttler(server, slack=5)
+
+        with throttler.acquire(httpx.Request(method, _URL)):
+            assert throttler._local_inflight == 0
+
+        throttler._semaphore.__enter__.assert_called_once()
@@ -0,0 +1,74 @@
+"""Unit tests for the lambda_framework package namespace."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import lambda_framework
+
+
+def _fresh_interpreter(code: str) -> str:
+    """Run *code* in a new interpreter and return its stripped stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+class TestLazyImports:
+    """Tests for lazy resolution of the package's public names."""
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Importing the package alone should not import FastAPI or botocore."""
+        out = _fresh_interpreter(
+            "import sys, lambda_framework; "
+            "print(sorted(m for m in ('fastapi', 'mangum', 'botocore') "
+            "if m in sys.modules))"
+        )
+        assert out == "[]"
+
+    def test_env_config_does_not_load_fastapi(self):
+        """Using EnvConfigBase should not pull in the webhook stack."""
+        out = _fresh_interpreter(
+            "import sys; from lambda_framework import EnvConfigBase; "
+            "print('fastapi' in sys.modules)"
+        )
+        assert out == "False"
+
+    def test_public_names_resolve(self):
+        """Every name in __all__ should resolve to its defining object."""
+        from lambda_framework.dispatch import create_dispatcher
+        from lambda_framework.env_config import EnvConfigBase
+        from lambda_framework.webhook import create_app
+
+        assert lambda_framework.EnvConfigBase is EnvConfigBase
+        assert lambda_framework.create_dispatcher is create_dispatcher
+        assert lambda_framework.create_app is create_app
+        for name in lambda_framework.__all__:
+            assert getattr(lambda_framework, name) is not None
+
+    def test_missing_optional_dependency_resolves_to_none(self, monkeypatch):
+        """Optional names should be None when their dependency is missing."""
+        # setitem records the original state (absent or resolved) so teardown
+        # also drops the None that __getattr__ caches during the test
+        monkeypatch.setitem(vars(lambda_framework), "SlackNotifier", None)
+        monkeypatch.delitem(vars(lambda_framework), "SlackNotifier")
+        with patch(
+            "lambda_framework.importlib.import_module",
+            side_effect=ImportError("No module named 'slack_sdk'"),
+        ):
+            assert lambda_framework.SlackNotifier is None
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should raise AttributeError."""
+        with pytest.raises(
+            AttributeError,
+            match="module 'lambda_framework' has no attribute 'UNKNOWN'",
+        ):
+            lambda_framework.UNKNOWN  # noqa: B018
+
+    def test_dir_lists_lazy_names(self):
+        """dir() should include names that have not been resolved yet."""
+        assert set(lambda_framework.__all__) <= set(dir(lambda_framework))